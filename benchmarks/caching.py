@@ -0,0 +1,81 @@
+"""
+Benchmarks cache entries loading latency & disk footprint
+with and without compression.
+
+Each given directory is used as a home directory of a fresh cache,
+so passing directories from different storages
+(e.g. a network-attached one along with a local one)
+allows to compare them:
+
+    python benchmarks/caching.py /mnt/nfs/paradigm-bench /tmp/paradigm-bench
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+_COMPRESSIONS = (None, 'zlib', 'lzma')
+_STATEMENT = (
+    'from paradigm.base import signature_from_callable; '
+    'import collections, pathlib; '
+    'signature_from_callable(pathlib.Path.open); '
+    'signature_from_callable(collections.OrderedDict.move_to_end)'
+)
+
+
+def _run(home_directory: Path, compression: str | None, /) -> float:
+    environment = {
+        **os.environ,
+        'HOME': str(home_directory),
+        'PARADIGM_CACHE_COMPRESSION': compression or '',
+        'USERPROFILE': str(home_directory),
+    }
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-c', _STATEMENT], check=True, env=environment
+    )
+    return time.perf_counter() - start
+
+
+def _to_footprint(directory: Path, /) -> int:
+    return sum(
+        path.stat().st_size for path in directory.rglob('*') if path.is_file()
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('directories', nargs='+', type=Path)
+    parser.add_argument('--repeats', default=5, type=int)
+    arguments = parser.parse_args()
+    print(  # noqa: T201
+        f'{"directory":<40} {"compression":<12} '
+        f'{"cold, s":>8} {"warm median, s":>15} {"footprint, MiB":>15}'
+    )
+    for directory in arguments.directories:
+        for compression in _COMPRESSIONS:
+            compression_name = compression or 'none'
+            home_directory = directory / compression_name
+            home_directory.mkdir(exist_ok=True, parents=True)
+            cold_duration = _run(home_directory, compression)
+            warm_durations = [
+                _run(home_directory, compression)
+                for _ in range(arguments.repeats)
+            ]
+            footprint = _to_footprint(home_directory / '.cache')
+            print(  # noqa: T201
+                f'{directory!s:<40} {compression_name:<12} '
+                f'{cold_duration:>8.3f} '
+                f'{statistics.median(warm_durations):>15.3f} '
+                f'{footprint / (1 << 20):>15.2f}'
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmarks resolution latency of representative standard library names
+against stubs definitions, e.g. re-export chains like
+
+    os.path.join -> posixpath.join
+
+or members inherited through superclasses like
+
+    builtins.bool.__add__ -> builtins.int.__add__
+
+as well as names missing from stubs, which exhaust all lookups.
+Stubs are loaded before measurements, so only resolution itself is timed:
+
+    python benchmarks/scoping.py --repeats 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import statistics
+import timeit
+
+from paradigm._core import catalog, scoping, stubs
+from paradigm._core.utils import MISSING, Missing
+
+_QUALIFIED_NAMES = (
+    ('asyncio', 'get_event_loop'),
+    ('builtins', 'bool.__add__'),
+    ('collections', 'OrderedDict.move_to_end'),
+    ('json', 'JSONDecodeError.__init__'),
+    ('os', 'path.join'),
+    ('pathlib', 'Path.open'),
+    ('tarfile', 'TarInfo.__init__'),
+    ('typing', 'Any'),
+    ('asyncio', 'missing'),
+    ('builtins', 'bool.missing'),
+    ('collections', 'OrderedDict.missing'),
+    ('os', 'path.missing'),
+)
+
+
+def _resolve(
+    qualified_path: catalog.QualifiedPath, /
+) -> catalog.QualifiedPath | Missing:
+    module_path, object_path = qualified_path
+    return scoping.lookup_object_path(
+        module_path,
+        (),
+        object_path,
+        stubs.definitions,
+        stubs.references,
+        stubs.submodules,
+        stubs.superclasses,
+    )
+
+
+def _to_resolved_name(
+    qualified_path: catalog.QualifiedPath | Missing, /
+) -> str:
+    if qualified_path is MISSING:
+        return '-'
+    module_path, object_path = qualified_path
+    return catalog.path_to_string(module_path + object_path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--number', default=1_000, type=int)
+    parser.add_argument('--repeats', default=5, type=int)
+    arguments = parser.parse_args()
+    print(f'{"name":<40} {"resolved":<40} {"median, us":>11}')  # noqa: T201
+    for module_name, object_name in _QUALIFIED_NAMES:
+        qualified_path = (
+            catalog.path_from_string(module_name),
+            catalog.path_from_string(object_name),
+        )
+        resolved_qualified_path = _resolve(qualified_path)
+        durations = timeit.repeat(
+            functools.partial(_resolve, qualified_path),
+            number=arguments.number,
+            repeat=arguments.repeats,
+        )
+        print(  # noqa: T201
+            f'{module_name + "." + object_name:<40} '
+            f'{_to_resolved_name(resolved_qualified_path):<40} '
+            f'{statistics.median(durations) / arguments.number * 1e6:>11.2f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
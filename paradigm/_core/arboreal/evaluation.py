@@ -347,14 +347,8 @@ def _(
 ) -> Any:
     assert isinstance(ast_node.ctx, ast.Load), ast_node
     object_name = ast_node.id
-    module_path, object_path = scoping.resolve_object_path(
-        module_path,
-        parent_path,
-        (object_name,),
-        stubs.definitions,
-        stubs.references,
-        stubs.submodules,
-        stubs.superclasses,
+    module_path, object_path = stubs.resolve_object_path(
+        module_path, parent_path, (object_name,)
     )
     return _evaluate_qualified_path(module_path, object_path, parent_namespace)
 
@@ -374,14 +368,8 @@ def _(
     try:
         return getattr(value, ast_node.attr)
     except AttributeError:
-        module_path, object_path = scoping.resolve_object_path(
-            module_path,
-            parent_path,
-            conversion.to_path(ast_node),
-            stubs.definitions,
-            stubs.references,
-            stubs.submodules,
-            stubs.superclasses,
+        module_path, object_path = stubs.resolve_object_path(
+            module_path, parent_path, conversion.to_path(ast_node)
         )
         return _evaluate_qualified_path(
             module_path, object_path, parent_namespace
@@ -513,14 +501,8 @@ def _evaluate_qualified_path(
                 if is_dependency_name(child)
             }:
                 dependency_module_path, dependency_object_path = (
-                    scoping.resolve_object_path(
-                        module_path,
-                        object_path,
-                        (dependency_name,),
-                        stubs.definitions,
-                        stubs.references,
-                        stubs.submodules,
-                        stubs.superclasses,
+                    stubs.resolve_object_path(
+                        module_path, object_path, (dependency_name,)
                     )
                 )
                 if dependency_module_path != builtins_module_path:
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any, Final, TYPE_CHECKING
+
+from . import signatures
+from .models import Signature
+from .utils import MISSING
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+
+async def signature_from_callable(
+    callable_: Callable[..., Any], /, *, executor: Executor | None
+) -> Signature:
+    # loading `asyncio` only when it is needed
+    import asyncio
+
+    result = signatures.cache.lookup(callable_)
+    if result is not MISSING:
+        return result
+    loop = asyncio.get_running_loop()
+    try:
+        hash(callable_)
+    except TypeError:
+        return await loop.run_in_executor(executor, _compute, callable_)
+    loop_computations = _computations.setdefault(loop, {})
+    try:
+        computation = loop_computations[callable_]
+    except KeyError:
+        computation = loop_computations[callable_] = loop.run_in_executor(
+            executor, _compute, callable_
+        )
+        computation.add_done_callback(
+            lambda _: loop_computations.pop(callable_, None)
+        )
+    # computation is shared by concurrent callers,
+    # so cancelling one of them should not affect the others
+    return await asyncio.shield(computation)
+
+
+async def signatures_from_callables(
+    callables: Iterable[Callable[..., Any]], /, *, executor: Executor | None
+) -> list[Signature | Exception]:
+    import asyncio
+
+    results = await asyncio.gather(
+        *[
+            signature_from_callable(callable_, executor=executor)
+            for callable_ in callables
+        ],
+        return_exceptions=True,
+    )
+    result: list[Signature | Exception] = []
+    for value in results:
+        if isinstance(value, BaseException) and not isinstance(
+            value, Exception
+        ):
+            raise value
+        result.append(value)
+    return result
+
+
+_computations: Final[
+    weakref.WeakKeyDictionary[
+        asyncio.AbstractEventLoop, dict[Hashable, asyncio.Future[Signature]]
+    ]
+] = weakref.WeakKeyDictionary()
+# stubs state is populated lazily not only by modules loading,
+# but also by lookups building derived tables from it,
+# so it is not safe to share between threads
+_computation_lock: Final[threading.Lock] = threading.Lock()
+
+
+def _compute(callable_: Callable[..., Any], /) -> Signature:
+    # cache is already looked up by the caller,
+    # so memoized entry point would count the miss twice
+    with _computation_lock:
+        result = signatures.from_callable(callable_)
+    signatures.cache.store(callable_, result)
+    return result
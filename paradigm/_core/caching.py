@@ -1,29 +1,121 @@
+import hashlib
+import lzma
+import marshal
+import os
 import warnings
+import zlib
+from collections.abc import Callable, Mapping
 from compileall import compile_file
-from importlib.util import module_from_spec, spec_from_file_location
-from operator import attrgetter
+from importlib.util import (
+    MAGIC_NUMBER,
+    module_from_spec,
+    spec_from_file_location,
+)
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Any
+from types import ModuleType
+from typing import Any, Final, TypeAlias
 
-from . import pretty
+from . import file_system, pretty
 
+Migration: TypeAlias = Callable[[dict[str, Any]], dict[str, Any]]
+
+# should be bumped on each incompatible change of cache files layout,
+# so package versions with different layouts
+# do not overwrite each other's files
+LAYOUT_DIRECTORY_NAME: Final[str] = 'v2'
+
+_COMPRESSIONS: Final[
+    Mapping[str, tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]]
+] = {
+    'lzma': (lzma.compress, lzma.decompress),
+    'zlib': (zlib.compress, zlib.decompress),
+}
+COMPRESSION_ENVIRONMENT_VARIABLE_NAME: Final[str] = (
+    'PARADIGM_CACHE_COMPRESSION'
+)
+
+
+def _to_compression() -> str | None:
+    result = os.environ.get(COMPRESSION_ENVIRONMENT_VARIABLE_NAME) or None
+    if result is not None and result not in _COMPRESSIONS:
+        # misconfigured cache should not make the package unusable
+        warnings.warn(
+            f'Invalid "{COMPRESSION_ENVIRONMENT_VARIABLE_NAME}" value: '
+            f'expected one of {", ".join(map(repr, _COMPRESSIONS))}, '
+            f'but found {result!r}, falling back to no compression.',
+            UserWarning,
+            stacklevel=2,
+        )
+        return None
+    return result
+
+
+COMPRESSION: Final[str | None] = _to_compression()
+
+
+class OutdatedSchema(Exception):
+    pass
 
-def load(path: Path, name: str, /, *names: str) -> tuple[Any, ...]:
-    spec = spec_from_file_location(path.stem, path)
-    assert spec is not None, path
-    module = module_from_spec(spec)
-    spec_loader = spec.loader
-    assert spec_loader is not None, path
-    spec_loader.exec_module(module)
-    return attrgetter(name, *names)(module)
+
+def load(path: Path, name: str, /, *names: str) -> Any:
+    return attrgetter(name, *names)(_load_module(path))
+
+
+def load_migrated(
+    path: Path,
+    schema_version_name: str,
+    schema_version: int,
+    migrations: Mapping[int, Migration],
+    name: str,
+    /,
+    *names: str,
+) -> Any:
+    values = {
+        field_name: value
+        for field_name, value in vars(_load_module(path)).items()
+        if not field_name.startswith('__')
+    }
+    cached_schema_version = values.pop(schema_version_name, None)
+    if cached_schema_version != schema_version:
+        if not (
+            isinstance(cached_schema_version, int)
+            and cached_schema_version < schema_version
+        ):
+            raise OutdatedSchema(path, cached_schema_version)
+        for version in range(cached_schema_version, schema_version):
+            try:
+                migration = migrations[version]
+            except KeyError:
+                raise OutdatedSchema(path, version) from None
+            values = migration(values)
+        # upgrading in-place to avoid migrating on each load
+        save(path, **values, **{schema_version_name: schema_version})
+    return itemgetter(name, *names)(values)
 
 
 def save(path: Path, /, **values: Any) -> None:
     try:
-        with path.open('w', encoding='utf-8') as file:
-            for name, value in values.items():
-                file.write(f'{name} = ' + pretty.repr_from(value, 4, 0) + '\n')
-        compile_file(path, quiet=2)
+        if COMPRESSION is None:
+            with path.open('w', encoding='utf-8') as file:
+                for name, value in values.items():
+                    file.write(
+                        f'{name} = ' + pretty.repr_from(value, 4, 0) + '\n'
+                    )
+            compile_file(path, quiet=2)
+        else:
+            compress, _ = _COMPRESSIONS[COMPRESSION]
+            source = ''.join(
+                [
+                    f'{name} = ' + pretty.repr_from(value, 0, 0) + '\n'
+                    for name, value in values.items()
+                ]
+            )
+            # storing bytecode to avoid compiling on each load
+            code = compile(source, str(path), 'exec')
+            _to_compressed_file_path(path, COMPRESSION).write_bytes(
+                MAGIC_NUMBER + compress(marshal.dumps(code))
+            )
     except Exception as error:
         warnings.warn(
             f'Failed saving "{path}". '
@@ -31,3 +123,51 @@ def save(path: Path, /, **values: Any) -> None:
             UserWarning,
             stacklevel=2,
         )
+
+
+def to_digest(*chunks: bytes) -> str:
+    hasher = hashlib.sha256()
+    for chunk in chunks:
+        # length-prefixing makes chunks boundaries unambiguous
+        hasher.update(len(chunk).to_bytes(8, 'little'))
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def to_object_file_path(directory_path: Path, digest: str, /) -> Path:
+    bucket_directory_path = directory_path / digest[:2]
+    bucket_directory_path.mkdir(exist_ok=True, parents=True)
+    # prefixing since module names can't start with a digit
+    return bucket_directory_path / (
+        f'_{digest[2:]}{file_system.MODULE_FILE_SUFFIX}'
+    )
+
+
+def _to_compressed_file_path(path: Path, compression: str, /) -> Path:
+    return path.with_name(f'{path.name}.{compression}')
+
+
+def _load_module(path: Path, /) -> ModuleType:
+    if COMPRESSION is not None:
+        try:
+            raw_payload = _to_compressed_file_path(
+                path, COMPRESSION
+            ).read_bytes()
+        except FileNotFoundError:
+            # falling back to uncompressed entry if any
+            pass
+        else:
+            _, decompress = _COMPRESSIONS[COMPRESSION]
+            if not raw_payload.startswith(MAGIC_NUMBER):
+                raise OutdatedSchema(path, raw_payload[: len(MAGIC_NUMBER)])
+            code = marshal.loads(decompress(raw_payload[len(MAGIC_NUMBER) :]))
+            result = ModuleType(path.stem)
+            exec(code, vars(result))
+            return result
+    spec = spec_from_file_location(path.stem, path)
+    assert spec is not None, path
+    module = module_from_spec(spec)
+    spec_loader = spec.loader
+    assert spec_loader is not None, path
+    spec_loader.exec_module(module)
+    return module
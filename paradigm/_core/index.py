@@ -10,7 +10,6 @@ import mypy as _mypy
 from mypy.version import __version__ as _mypy_version
 
 import paradigm
-from paradigm import __version__ as _version
 from paradigm._core import (
     caching as _caching,
     catalog as _catalog,
@@ -35,6 +34,7 @@ _CACHE_ROOT_DIRECTORY_PATH: _Final[_Path] = (
     _Path.home()
     / '.cache'
     / paradigm.__name__
+    / _caching.LAYOUT_DIRECTORY_NAME
     / (_CACHE_ROOT_DIRECTORY_NAME_PREFIX + '_' + _Path(__file__).stem)
 )
 _CACHE_ROOT_DIRECTORY_PATH.mkdir(exist_ok=True, parents=True)
@@ -42,7 +42,15 @@ _CACHE_ROOT_DIRECTORY_PATH.mkdir(exist_ok=True, parents=True)
 
 class _FieldName:
     QUALIFIED_PATHS = 'qualified_paths'
-    VERSION = 'version'
+    SCHEMA_VERSION = 'schema_version'
+
+
+# should be bumped on each change of the fields layout
+# or of indexing logic changing their values,
+# older entries get rebuilt unless there is a migration
+# registered for their schema version (upgrading it by one)
+_SCHEMA_VERSION: _Final[int] = 1
+_SCHEMA_MIGRATIONS: _Final[_Mapping[int, _caching.Migration]] = {}
 
 
 QualifiedPaths: _TypeAlias = _Mapping[
@@ -80,14 +88,17 @@ def from_module(
         _catalog.Path, dict[_catalog.Path, list[_catalog.QualifiedPath]]
     ]
     try:
-        (result, cached_version) = _caching.load(
-            cache_file_path, _FieldName.QUALIFIED_PATHS, _FieldName.VERSION
+        result = _caching.load_migrated(
+            cache_file_path,
+            _FieldName.SCHEMA_VERSION,
+            _SCHEMA_VERSION,
+            _SCHEMA_MIGRATIONS,
+            _FieldName.QUALIFIED_PATHS,
         )
     except Exception:
         pass
     else:
-        if cached_version == _version:
-            return result
+        return result
     result = {}
     _index_module_or_type(
         module,
@@ -98,7 +109,10 @@ def from_module(
     )
     _caching.save(
         cache_file_path,
-        **{_FieldName.QUALIFIED_PATHS: result, _FieldName.VERSION: _version},
+        **{
+            _FieldName.QUALIFIED_PATHS: result,
+            _FieldName.SCHEMA_VERSION: _SCHEMA_VERSION,
+        },
     )
     return result
 
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, Final, Generic, NamedTuple, TypeVar
+
+from .utils import MISSING, Missing
+
+_VT = TypeVar('_VT')
+
+# values can refer to their keys (e.g. signature of a class mentioning it),
+# keeping them alive, so caches are bounded by default
+DEFAULT_MAX_SIZE: Final[int] = 1024
+
+Sources = tuple[tuple[Any, ...], ...]
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    max_size: int | None
+    size: int
+
+
+def to_maybe_reference(
+    value: Any, /, *, strongly_referenced_types: tuple[type, ...]
+) -> Callable[[], Any] | None:
+    # strong references to other values could keep them
+    # (and objects they are bound to) alive indefinitely
+    if isinstance(value, strongly_referenced_types):
+        return to_reference(value)
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        return None
+
+
+def to_reference(value: Any, /) -> Callable[[], Any]:
+    try:
+        return weakref.ref(value)
+    except TypeError:
+        # descriptors of built-in classes
+        # do not support weak references, but live as long as classes
+        def reference() -> Any:
+            return value
+
+        return reference
+
+
+def are_identical_sources(left: Sources, right: Sources, /) -> bool:
+    return len(left) == len(right) and all(
+        len(left_objects) == len(right_objects)
+        and all(
+            left_object is right_object
+            for left_object, right_object in zip(
+                left_objects, right_objects, strict=True
+            )
+        )
+        for left_objects, right_objects in zip(left, right, strict=True)
+    )
+
+
+def _to_no_sources(_key: Any, /) -> Sources:
+    return ()
+
+
+# LRU cache which references its keys weakly when possible
+# and strongly if their types are registered as having stable identity,
+# values for other keys are not cached,
+# entries are valid while objects their values were computed from
+# (as given by `to_sources`) stay the same
+class WeakCache(Generic[_VT]):
+    @property
+    def max_size(self, /) -> int | None:
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, value: int | None, /) -> None:
+        if value is not None and value < 0:
+            raise ValueError(
+                f'Max size should be non-negative, but found {value!r}.'
+            )
+        with self._lock:
+            self._max_size = value
+            self._evict()
+
+    def clear(self, /) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending_removals.clear()
+            self._hits = self._misses = 0
+
+    def info(self, /) -> CacheInfo:
+        with self._lock:
+            self._purge()
+            return CacheInfo(
+                self._hits, self._misses, self._max_size, len(self._entries)
+            )
+
+    def lookup(self, key: Any, /) -> _VT | Missing:
+        entry_key = self._to_entry_key(key, callback=None)
+        if entry_key is None:
+            return MISSING
+        sources = self._to_sources(key)
+        if sources is None:
+            return MISSING
+        with self._lock:
+            self._purge()
+            try:
+                cached_sources, result = self._entries[entry_key]
+            except KeyError:
+                self._misses += 1
+                return MISSING
+            if not are_identical_sources(cached_sources, sources):
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(entry_key)
+            self._hits += 1
+            return result
+
+    def store(self, key: Any, value: _VT, /) -> None:
+        entry_key = self._to_entry_key(
+            key, callback=self._pending_removals.append
+        )
+        if entry_key is None:
+            return
+        sources = self._to_sources(key)
+        if sources is None:
+            return
+        with self._lock:
+            self._purge()
+            self._entries[entry_key] = sources, value
+            self._entries.move_to_end(entry_key)
+            self._evict()
+
+    __slots__ = (
+        '__weakref__',
+        '_entries',
+        '_hits',
+        '_lock',
+        '_max_size',
+        '_misses',
+        '_pending_removals',
+        '_strongly_referenced_types',
+        '_to_sources',
+    )
+
+    _entries: OrderedDict[Hashable, tuple[Sources, _VT]]
+    _hits: int
+    _lock: threading.RLock
+    _max_size: int | None
+    _misses: int
+    _pending_removals: list[weakref.ref[Any]]
+    _strongly_referenced_types: tuple[type, ...]
+    _to_sources: Callable[[Any], Sources | None]
+
+    def __init__(
+        self,
+        /,
+        *,
+        max_size: int | None = DEFAULT_MAX_SIZE,
+        strongly_referenced_types: tuple[type, ...] = (),
+        to_sources: Callable[[Any], Sources | None] = _to_no_sources,
+    ) -> None:
+        self._entries = OrderedDict()
+        self._hits = self._misses = 0
+        self._lock = threading.RLock()
+        self._max_size = None
+        # weak references callbacks can be called on garbage collection
+        # at any point, so removals are deferred till the next access
+        self._pending_removals: list[weakref.ref[Any]] = []
+        self._strongly_referenced_types = strongly_referenced_types
+        # keys without sources cannot be validated, so are not cached
+        self._to_sources = to_sources
+        self.max_size = max_size
+
+    def _evict(self, /) -> None:
+        max_size = self._max_size
+        if max_size is not None:
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def _purge(self, /) -> None:
+        while self._pending_removals:
+            self._entries.pop(self._pending_removals.pop(), None)
+
+    def _to_entry_key(
+        self,
+        key: Any,
+        /,
+        *,
+        callback: Callable[[weakref.ref[Any]], Any] | None,
+    ) -> Hashable | None:
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        if isinstance(key, self._strongly_referenced_types):
+            return key
+        try:
+            return weakref.ref(key, callback)
+        except TypeError:
+            return None
+
+
+# LRU cache of values computed from classes attributes,
+# classes are referenced weakly
+# and entries get invalidated when the attribute is replaced
+class AttributesCache(Generic[_VT]):
+    def clear(self, /) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pending_removals.clear()
+
+    def lookup(self, cls: type, name: str, attribute: Any, /) -> _VT | Missing:
+        try:
+            entry_key = (weakref.ref(cls), name)
+        except TypeError:
+            return MISSING
+        with self._lock:
+            self._purge()
+            try:
+                attribute_reference, value = self._entries[entry_key]
+            except KeyError:
+                return MISSING
+            if attribute_reference() is not attribute:
+                return MISSING
+            self._entries.move_to_end(entry_key)
+            return value
+
+    def store(
+        self, cls: type, name: str, attribute: Any, value: _VT, /
+    ) -> None:
+        try:
+            entry_key = (weakref.ref(cls, self._pending_removals.append), name)
+        except TypeError:
+            return
+        with self._lock:
+            self._purge()
+            self._entries[entry_key] = (to_reference(attribute), value)
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    __slots__ = ('_entries', '_lock', '_max_size', '_pending_removals')
+
+    _entries: OrderedDict[
+        tuple[weakref.ref[type], str], tuple[Callable[[], Any], _VT]
+    ]
+    _lock: threading.RLock
+    _max_size: int
+    _pending_removals: list[weakref.ref[type]]
+
+    def __init__(self, /, *, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_size = max_size
+        # removals are deferred like in `WeakCache`
+        self._pending_removals = []
+
+    def _purge(self, /) -> None:
+        if not self._pending_removals:
+            return
+        self._pending_removals.clear()
+        # several references to the same class can be created,
+        # so dead entries are looked up by their keys
+        for entry_key in [
+            entry_key for entry_key in self._entries if entry_key[0]() is None
+        ]:
+            del self._entries[entry_key]
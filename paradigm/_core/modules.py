@@ -1,5 +1,7 @@
 import sys as _sys
 import sysconfig as _sysconfig
+import threading as _threading
+import weakref as _weakref
 from collections.abc import (
     Iterator as _Iterator,
     Mapping as _Mapping,
@@ -7,6 +9,7 @@ from collections.abc import (
 )
 from pathlib import Path as _Path
 from types import ModuleType as _ModuleType
+from typing import Final as _Final
 
 from . import (
     catalog as _catalog,
@@ -25,6 +28,7 @@ class _State(
     def __getitem__(
         self, module_path: _catalog.Path, /
     ) -> _Mapping[_catalog.Path, _Sequence[_catalog.QualifiedPath]]:
+        self._sync()
         try:
             return self._inner[module_path]
         except KeyError as error:
@@ -33,6 +37,9 @@ class _State(
                 module = _sys.modules[module_name]
             except KeyError:
                 raise error from None
+            if self._processed_modules.get(module_name) is module:
+                # module has nothing supported
+                raise error from None
             _process_module(
                 module,
                 self._inner,
@@ -41,6 +48,8 @@ class _State(
                 self._submodules,
                 self._superclasses,
             )
+            self._processed_modules[module_name] = module
+            self._generation += 1
             try:
                 return self._inner[module_path]
             except KeyError:
@@ -63,39 +72,89 @@ class _State(
         self._inner: dict[
             _catalog.Path, dict[_catalog.Path, list[_catalog.QualifiedPath]]
         ] = {}
-        stdlib_base_directory_path = _Path(
-            _sysconfig.get_path('stdlib')
-        ).resolve(strict=True)
-        for module in _sys.modules.copy().values():
-            if (
-                (
-                    (
-                        module_file_path_string := getattr(
-                            module, '__file__', None
-                        )
-                    )
-                    is None
-                )
-                or _Path(module_file_path_string).is_relative_to(
-                    stdlib_base_directory_path
-                )
-                or module.__name__ in _sys.builtin_module_names
-            ):
-                _process_module(
-                    module,
-                    self._inner,
-                    self._definitions,
-                    self._references,
-                    self._submodules,
-                    self._superclasses,
-                )
+        # reloaded modules are new objects, so they get processed again
+        self._processed_modules: _weakref.WeakValueDictionary[
+            str, _ModuleType
+        ] = _weakref.WeakValueDictionary()
+        self._checked_modules: _weakref.WeakValueDictionary[
+            str, _ModuleType
+        ] = _weakref.WeakValueDictionary()
+        # snapshot keeps its modules alive, so identities stay unambiguous
+        self._modules: dict[str, _ModuleType] = {}
+        self._generation = 0
+        self._sync_lock = _threading.RLock()
+        self._sync()
 
     def __iter__(self, /) -> _Iterator[_catalog.Path]:
+        self._sync()
         return iter(self._inner)
 
     def __len__(self, /) -> int:
+        self._sync()
         return len(self._inner)
 
+    @property
+    def generation(self, /) -> int:
+        self._sync()
+        return self._generation
+
+    def _sync(self, /) -> None:
+        # objects of a module imported later can claim paths
+        # of already processed modules (e.g. `_pydecimal` ones are
+        # located at `decimal`), so newly imported modules
+        # should be processed before any lookup
+        # modules have no custom equality,
+        # so this compares them by identities
+        # and catches the ones replaced under the same names
+        if _sys.modules == self._modules:
+            return
+        with self._sync_lock:
+            modules = _sys.modules.copy()
+            for module_name, module in modules.items():
+                if (
+                    not isinstance(module, _ModuleType)
+                    or self._checked_modules.get(module_name) is module
+                ):
+                    continue
+                self._checked_modules[module_name] = module
+                if self._processed_modules.get(
+                    module_name
+                ) is not module and is_stdlib_module(module):
+                    _process_module(
+                        module,
+                        self._inner,
+                        self._definitions,
+                        self._references,
+                        self._submodules,
+                        self._superclasses,
+                    )
+                    self._processed_modules[module_name] = module
+                    self._generation += 1
+            self._modules = modules
+
+
+_STDLIB_BASE_DIRECTORY_PATH: _Final[_Path] = _Path(
+    _sysconfig.get_path('stdlib')
+).resolve(strict=True)
+
+
+def is_stdlib_module(module: _ModuleType, /) -> bool:
+    if module.__name__ in _sys.builtin_module_names:
+        return True
+    module_file_path_string = getattr(module, '__file__', None)
+    if module_file_path_string is None:
+        # modules without files can be created dynamically
+        # (e.g. REPL's `__main__` or `types.ModuleType` instances),
+        # so only frozen ones of them are from stdlib
+        module_spec = getattr(module, '__spec__', None)
+        return (
+            module_spec is not None
+            and getattr(module_spec, 'origin', None) == 'frozen'
+        )
+    return _Path(module_file_path_string).is_relative_to(
+        _STDLIB_BASE_DIRECTORY_PATH
+    )
+
 
 def _process_module(
     module: _ModuleType,
@@ -136,9 +195,15 @@ def _process_module(
                 )
                 > 0
             ):
-                supported_module_qualified_paths.setdefault(
+                candidates = supported_module_qualified_paths.setdefault(
                     object_path, []
-                ).extend(supported_object_qualified_paths)
+                )
+                # reloaded modules are processed again
+                candidates.extend(
+                    qualified_path
+                    for qualified_path in supported_object_qualified_paths
+                    if qualified_path not in candidates
+                )
 
 
 supported_stdlib_qualified_paths = _State(
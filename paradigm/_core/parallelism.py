@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import builtins
+import pickle
+import sys
+from collections.abc import Iterable, Iterator
+from importlib import import_module
+
+from . import catalog, namespacing, signatures, stubs
+from .models import Signature
+from .utils import MISSING, Missing
+
+
+def signatures_from_modules(
+    module_names: Iterable[str], /, *, max_workers: int | None, recursive: bool
+) -> Iterator[tuple[str, dict[str, Signature | Exception]]]:
+    # loading `multiprocessing` machinery only when it is needed
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_warm_up
+    )
+    try:
+        futures = {
+            executor.submit(
+                _signatures_from_module_name, module_name, recursive=recursive
+            ): module_name
+            for module_name in dict.fromkeys(module_names)
+        }
+        for future in as_completed(futures):
+            module_name = futures[future]
+            yield (
+                module_name,
+                _complete_signatures(module_name, future.result()),
+            )
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _complete_signatures(
+    module_name: str, payloads: dict[str, bytes | Missing], /
+) -> dict[str, Signature | Exception]:
+    result: dict[str, Signature | Exception] = {}
+    for name, payload in payloads.items():
+        try:
+            if payload is MISSING:
+                raise pickle.PicklingError(name)
+            result[name] = pickle.loads(payload)
+        except Exception:
+            # not transferable from worker, resolving locally
+            result[name] = _signature_from_qualified_name(module_name, name)
+    return result
+
+
+def _signature_from_qualified_name(
+    module_name: str, name: str, /
+) -> Signature | Exception:
+    try:
+        import_module(module_name)
+        path = catalog.path_from_string(name)
+        module_path = next(
+            path[:length]
+            for length in range(len(path) - 1, 0, -1)
+            if catalog.path_to_string(path[:length]) in sys.modules
+        )
+        return signatures.memoized_from_callable(
+            namespacing.search(
+                sys.modules[catalog.path_to_string(module_path)],
+                path[len(module_path) :],
+            )
+        )
+    except Exception as error:
+        return error
+
+
+def _signatures_from_module_name(
+    module_name: str, /, *, recursive: bool
+) -> dict[str, bytes | Missing]:
+    # import failures are re-raised by the caller
+    # instead of being reported as signatures
+    module = import_module(module_name)
+    return {
+        name: _to_payload(value)
+        for name, value in signatures.from_module(
+            module, recursive=recursive
+        ).items()
+    }
+
+
+def _to_payload(value: Signature | Exception, /) -> bytes | Missing:
+    # annotations evaluated from stubs-only definitions
+    # (e.g. type variables) can't be restored by reference,
+    # so values are unpickled by the caller item by item
+    try:
+        return pickle.dumps(value)
+    except Exception:
+        return MISSING
+
+
+def _warm_up() -> None:
+    stubs.superclasses[catalog.module_path_from_module(builtins)]
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import builtins
-from collections.abc import Collection, Mapping
+from collections.abc import Collection, Generator, Mapping
 from typing import Final, TypeAlias
 
 from . import catalog
+from .utils import MISSING, Missing
 
 SPECIALIZATION_SCOPE_NAME: Final[str] = '@specializations'
 
@@ -39,8 +40,8 @@ def contains_object_path(
     module_superclasses: Mapping[catalog.Path, ModuleSuperclasses],
     /,
 ) -> bool:
-    try:
-        resolve_object_path(
+    return (
+        lookup_object_path(
             module_path,
             parent_path,
             object_path,
@@ -49,10 +50,8 @@ def contains_object_path(
             module_submodules,
             module_superclasses,
         )
-    except ObjectNotFound:
-        return False
-    else:
-        return True
+        is not MISSING
+    )
 
 
 def resolve_object_path(
@@ -65,30 +64,170 @@ def resolve_object_path(
     module_superclasses: Mapping[catalog.Path, ModuleSuperclasses],
     /,
     *visited_module_paths: catalog.Path,
+) -> catalog.QualifiedPath:
+    result = lookup_object_path(
+        module_path,
+        parent_path,
+        object_path,
+        module_scopes,
+        module_references,
+        module_submodules,
+        module_superclasses,
+        *visited_module_paths,
+    )
+    if result is MISSING:
+        raise ObjectNotFound((module_path, object_path))
+    return result
+
+
+def lookup_object_path(
+    module_path: catalog.Path,
+    parent_path: catalog.Path,
+    object_path: catalog.Path,
+    module_scopes: Mapping[catalog.Path, Scope],
+    module_references: Mapping[catalog.Path, ModuleReferences],
+    module_submodules: Mapping[catalog.Path, ModuleSubmodules],
+    module_superclasses: Mapping[catalog.Path, ModuleSuperclasses],
+    /,
+    *visited_module_paths: catalog.Path,
     _builtins_module_path: catalog.Path = catalog.module_path_from_module(  # noqa: B008
         builtins
     ),
-) -> catalog.QualifiedPath:
-    try:
-        scope = module_scopes[module_path]
-    except KeyError:
-        raise ObjectNotFound((module_path, object_path)) from None
+) -> catalog.QualifiedPath | Missing:
+    result: catalog.QualifiedPath | Missing | None = _resolve_locally(
+        module_path, parent_path, object_path, module_scopes
+    )
+    if result is not None:
+        return result
+    # resolution is a depth-first search with backtracking,
+    # each of its steps is a generator which yields nested lookups
+    # and gets their results (or `MISSING` for failures) sent back,
+    # so long chains do not consume the interpreter stack
+    # and failures do not unwind it with exceptions
+    visited_module_paths_set = set(visited_module_paths)
+    active_lookups: set[_Lookup] = set()
+    frames: list[tuple[_Frame, _Lookup, catalog.Path | None]] = []
+    lookup: _Lookup | None = (module_path, parent_path, object_path)
+    visiting_module_path: catalog.Path | None = None
+    while True:
+        if lookup is not None:
+            if lookup in active_lookups:
+                # cyclic lookup would never succeed
+                result = MISSING
+            else:
+                result = _resolve_locally(*lookup, module_scopes)
+                if result is None:
+                    active_lookups.add(lookup)
+                    if (
+                        visiting_module_path is not None
+                        and visiting_module_path
+                        not in visited_module_paths_set
+                    ):
+                        visited_module_paths_set.add(visiting_module_path)
+                    else:
+                        visiting_module_path = None
+                    frames.append(
+                        (
+                            _resolve_step(
+                                *lookup,
+                                module_scopes,
+                                module_references,
+                                module_submodules,
+                                module_superclasses,
+                                visited_module_paths_set,
+                                _builtins_module_path,
+                            ),
+                            lookup,
+                            visiting_module_path,
+                        )
+                    )
+            lookup = None
+        frame, frame_lookup, frame_visiting_module_path = frames[-1]
+        try:
+            request = frame.send(result)
+        except StopIteration as stop:
+            result = stop.value
+        else:
+            (
+                request_module_path,
+                request_parent_path,
+                request_object_path,
+                marks_visited,
+            ) = request
+            lookup = (
+                request_module_path,
+                request_parent_path,
+                request_object_path,
+            )
+            visiting_module_path = frame_lookup[0] if marks_visited else None
+            result = None
+            continue
+        frames.pop()
+        active_lookups.remove(frame_lookup)
+        if frame_visiting_module_path is not None:
+            visited_module_paths_set.remove(frame_visiting_module_path)
+        if not frames:
+            assert result is not None
+            return result
+
+
+_Lookup: TypeAlias = tuple[catalog.Path, catalog.Path, catalog.Path]
+# nested lookup along with the flag
+# whether current module should be marked as visited for it
+_Request: TypeAlias = tuple[catalog.Path, catalog.Path, catalog.Path, bool]
+_Frame: TypeAlias = Generator[
+    _Request,
+    catalog.QualifiedPath | Missing | None,
+    catalog.QualifiedPath | Missing,
+]
+
+
+def _resolve_locally(
+    module_path: catalog.Path,
+    parent_path: catalog.Path,
+    object_path: catalog.Path,
+    module_scopes: Mapping[catalog.Path, Scope],
+    /,
+) -> catalog.QualifiedPath | Missing | None:
+    scope = module_scopes.get(module_path)
+    if scope is None:
+        return MISSING
+    if not object_path:
+        return (module_path, object_path)
+    if parent_path and scope_contains_path(
+        scope, (*parent_path, object_path[0])
+    ):
+        object_path, parent_path = parent_path + object_path, ()
+    if not parent_path and scope_contains_path(scope, object_path):
+        return (module_path, object_path)
+    # undecidable without nested lookups
+    return None
+
+
+def _resolve_step(
+    module_path: catalog.Path,
+    parent_path: catalog.Path,
+    object_path: catalog.Path,
+    module_scopes: Mapping[catalog.Path, Scope],
+    module_references: Mapping[catalog.Path, ModuleReferences],
+    module_submodules: Mapping[catalog.Path, ModuleSubmodules],
+    module_superclasses: Mapping[catalog.Path, ModuleSuperclasses],
+    visited_module_paths: Collection[catalog.Path],
+    builtins_module_path: catalog.Path,
+    /,
+) -> _Frame:
+    scope = module_scopes.get(module_path)
+    if scope is None:
+        return MISSING
     if not object_path:
         return (module_path, object_path)
     assert scope_contains_path(scope, parent_path)
     if parent_path and scope_contains_path(
         scope, (*parent_path, object_path[0])
     ):
-        return resolve_object_path(
-            module_path,
-            (),
-            parent_path + object_path,
-            module_scopes,
-            module_references,
-            module_submodules,
-            module_superclasses,
-            *visited_module_paths,
-        )
+        result = yield (module_path, (), parent_path + object_path, False)
+        assert result is not None
+        return result
     if object_path[0] in scope:
         superclasses, object_scope = (
             module_superclasses.get(module_path, {}),
@@ -98,102 +237,67 @@ def resolve_object_path(
             if sub_name in object_scope:
                 object_scope = object_scope[sub_name]
             else:
-                sub_path = object_path[:index]
-                try:
-                    sub_path_superclasses = superclasses[sub_path]
-                except KeyError:
-                    pass
-                else:
-                    for (
+                for (
+                    superclass_module_path,
+                    superclass_object_path,
+                ) in superclasses.get(object_path[:index], ()):
+                    result = yield (
                         superclass_module_path,
-                        superclass_object_path,
-                    ) in sub_path_superclasses:
-                        try:
-                            return resolve_object_path(
-                                superclass_module_path,
-                                (),
-                                superclass_object_path + object_path[index:],
-                                module_scopes,
-                                module_references,
-                                module_submodules,
-                                module_superclasses,
-                                *visited_module_paths,
-                                module_path,
-                            )
-                        except ObjectNotFound:
-                            continue
+                        (),
+                        superclass_object_path + object_path[index:],
+                        True,
+                    )
+                    assert result is not None
+                    if result is not MISSING:
+                        return result
                 if object_path[0] != object.__name__:
-                    return resolve_object_path(
-                        _builtins_module_path,
+                    result = yield (
+                        builtins_module_path,
                         (),
                         (object.__name__, *object_path[index:]),
-                        module_scopes,
-                        module_references,
-                        module_submodules,
-                        module_superclasses,
-                        *visited_module_paths,
+                        False,
                     )
-                raise ObjectNotFound((module_path, object_path))
+                    assert result is not None
+                    return result
+                return MISSING
         return (module_path, object_path)
     for sub_module_path in module_submodules.get(module_path, []):
         if sub_module_path not in visited_module_paths:
-            try:
-                return resolve_object_path(
-                    sub_module_path,
-                    (),
-                    object_path,
-                    module_scopes,
-                    module_references,
-                    module_submodules,
-                    module_superclasses,
-                    *visited_module_paths,
-                    module_path,
-                )
-            except ObjectNotFound:
-                continue
+            result = yield (sub_module_path, (), object_path, True)
+            assert result is not None
+            if result is not MISSING:
+                return result
     references = module_references[module_path]
     for offset in range(len(object_path)):
         sub_object_path = object_path[: len(object_path) - offset]
-        try:
-            referent_module_path, referent_object_path = references[
-                sub_object_path
-            ]
-        except KeyError:
+        reference = references.get(sub_object_path)
+        if reference is None:
             continue
+        referent_module_path, referent_object_path = reference
+        referent_result = yield (
+            referent_module_path,
+            (),
+            referent_object_path,
+            True,
+        )
+        assert referent_result is not None
+        if referent_result is MISSING:
+            referent_module_path += referent_object_path[:1]
+            referent_object_path = referent_object_path[1:]
+            if referent_module_path not in module_scopes:
+                # referent is neither an object nor a submodule,
+                # e.g. an attribute of a module-level instance
+                return MISSING
         else:
-            try:
-                referent_module_path, referent_object_path = (
-                    resolve_object_path(
-                        referent_module_path,
-                        (),
-                        referent_object_path,
-                        module_scopes,
-                        module_references,
-                        module_submodules,
-                        module_superclasses,
-                        *visited_module_paths,
-                        module_path,
-                    )
-                )
-            except ObjectNotFound:
-                referent_module_path += referent_object_path[:1]
-                referent_object_path = referent_object_path[1:]
-                assert referent_module_path in module_scopes, (
-                    module_path,
-                    object_path,
-                )
-            return resolve_object_path(
-                referent_module_path,
-                (),
-                referent_object_path
-                + object_path[len(object_path) - offset :],
-                module_scopes,
-                module_references,
-                module_submodules,
-                module_superclasses,
-                *visited_module_paths,
-                module_path,
-            )
-    if scope_contains_path(module_scopes[_builtins_module_path], object_path):
-        return _builtins_module_path, object_path
-    raise ObjectNotFound((module_path, object_path))
+            referent_module_path, referent_object_path = referent_result
+        result = yield (
+            referent_module_path,
+            (),
+            referent_object_path + object_path[len(object_path) - offset :],
+            True,
+        )
+        assert result is not None
+        return result
+    if scope_contains_path(module_scopes[builtins_module_path], object_path):
+        return (builtins_module_path, object_path)
+    return MISSING  # noqa: B901
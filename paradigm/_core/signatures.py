@@ -2,18 +2,26 @@ from __future__ import annotations
 
 import ast as _ast
 import builtins as _builtins
+import enum as _enum
 import inspect as _inspect
 import sys
 import types as _types
 import typing as _typing
-from collections.abc import Callable, Iterable, Sequence
+import weakref as _weakref
+from collections.abc import Callable, Container, Iterable, Sequence
 from functools import partial as _partial, singledispatch as _singledispatch
-from itertools import starmap, zip_longest as _zip_longest
+from itertools import chain as _chain, starmap, zip_longest as _zip_longest
 from typing import Any, Final, TypeVar
 
-from typing_extensions import Self as _Self
+from typing_extensions import Self as _Self, final as _final
 
-from . import catalog as _catalog, scoping as _scoping, stubs as _stubs
+from . import (
+    catalog as _catalog,
+    memoization as _memoization,
+    namespacing as _namespacing,
+    sources as _sources,
+    stubs as _stubs,
+)
 from .arboreal import conversion as _conversion
 from .arboreal.evaluation import (
     evaluate_expression_node as _evaluate_expression_node,
@@ -29,89 +37,110 @@ from .models import (
     Signature as _Signature,
     from_signatures as _from_signatures,
 )
-from .modules import supported_stdlib_qualified_paths as _qualified_paths
-from .utils import decorate_if as _decorate_if
+from .modules import (
+    is_stdlib_module as _is_stdlib_module,
+    supported_stdlib_qualified_paths as _qualified_paths,
+)
+from .utils import (
+    MISSING as _MISSING,
+    Missing as _Missing,
+    decorate_if as _decorate_if,
+)
 
 
-@_singledispatch
 def from_callable(callable_: Callable[..., Any], /) -> _Signature:
+    if _unwrapping_depth:
+        if isinstance(callable_, _types.MethodType):
+            innermost = _unwrap(callable_.__func__, _unwrapping_depth)
+            if innermost is not callable_.__func__:
+                return _from_unwrapped_callable(innermost).bind(
+                    callable_.__self__
+                )
+        else:
+            innermost = _unwrap(callable_, _unwrapping_depth)
+            if innermost is not callable_:
+                return _from_unwrapped_callable(innermost)
+    return _from_own_callable(callable_)
+
+
+def _from_unwrapped_callable(callable_: Callable[..., Any], /) -> _Signature:
+    # unwrapping is not applied again, so the depth does not compound
+    return (
+        # unwrapping has been stopped by the depth
+        _from_own_callable(callable_)
+        if _unwrap(callable_, 1) is not callable_
+        # wrappers share memoized signature of the wrapped callable
+        else memoized_from_callable(callable_)
+    )
+
+
+@_singledispatch
+def _from_own_callable(callable_: Callable[..., Any], /) -> _Signature:
     raise TypeError(type(callable_))
 
 
-@from_callable.register(_types.BuiltinFunctionType)
+@_from_own_callable.register(_types.BuiltinFunctionType)
 @_decorate_if(
-    from_callable.register(_types.BuiltinMethodType),
+    _from_own_callable.register(_types.BuiltinMethodType),
     sys.implementation.name != 'pypy',
 )
 def _(
     callable_: _types.BuiltinFunctionType | _types.BuiltinMethodType, /
 ) -> _Signature:
-    try:
-        return (
-            (
-                _from_callable(callable_)
-                if isinstance(callable_.__self__, type)
-                else (
-                    _from_callable(
-                        getattr(type(callable_.__self__), callable_.__name__)
-                    ).bind(callable_.__self__)
-                )
-            )
-            if (
-                callable_.__self__ is not None
-                and not isinstance(callable_.__self__, _types.ModuleType)
-            )
-            else _from_callable(callable_)
+    return _resolve(
+        callable_,
+        _partial(_from_instance_method, callable_.__self__, callable_.__name__)
+        if (
+            callable_.__self__ is not None
+            and not isinstance(callable_.__self__, (_types.ModuleType, type))
         )
-    except _SignatureNotFound:
-        return _from_raw_signature(_to_raw_signature(callable_))
+        else _partial(_from_callable, callable_),
+        _partial(_from_raw_callable, callable_),
+    )
 
 
-@from_callable.register(_types.FunctionType)
+@_from_own_callable.register(_types.FunctionType)
 def _(callable_: _types.FunctionType, /) -> _Signature:
-    try:
-        return _from_callable(callable_)
-    except _SignatureNotFound:
-        return _from_raw_signature(_to_raw_signature(callable_))
+    return _resolve(
+        callable_,
+        _partial(_from_callable, callable_),
+        _partial(_from_function, callable_),
+    )
 
 
-@from_callable.register(_types.MethodType)
+@_from_own_callable.register(_types.MethodType)
 def _(callable_: _types.MethodType, /) -> _Signature:
-    try:
-        return (
-            _from_callable(callable_)
-            if isinstance(callable_.__self__, type)
-            else (
-                _from_callable(
-                    getattr(type(callable_.__self__), callable_.__name__)
-                ).bind(callable_.__self__)
-            )
-        )
-    except _SignatureNotFound:
-        return _from_raw_signature(_to_raw_signature(callable_))
+    return _resolve(
+        callable_,
+        _partial(_from_callable, callable_)
+        if isinstance(callable_.__self__, type)
+        else _partial(
+            _from_instance_method, callable_.__self__, callable_.__name__
+        ),
+        _partial(_from_raw_callable, callable_),
+    )
 
 
 @_decorate_if(
-    from_callable.register(_types.MethodWrapperType),
+    _from_own_callable.register(_types.MethodWrapperType),
     sys.implementation.name != 'pypy',
 )
 def _(callable_: _types.MethodWrapperType, /) -> _Signature:
     self = callable_.__self__
     assert not isinstance(self, type), callable_
-    try:
-        return _from_callable(getattr(type(self), callable_.__name__)).bind(
-            self
-        )
-    except _SignatureNotFound:
-        return _from_raw_signature(_to_raw_signature(callable_))
+    return _resolve(
+        callable_,
+        _partial(_from_instance_method, self, callable_.__name__),
+        _partial(_from_raw_callable, callable_),
+    )
 
 
 @_decorate_if(
-    from_callable.register(_types.MethodDescriptorType),
+    _from_own_callable.register(_types.MethodDescriptorType),
     sys.implementation.name != 'pypy',
 )
 @_decorate_if(
-    from_callable.register(_types.WrapperDescriptorType),
+    _from_own_callable.register(_types.WrapperDescriptorType),
     sys.implementation.name != 'pypy',
 )
 def _(
@@ -119,51 +148,559 @@ def _(
 ) -> _Signature:
     cls = callable_.__objclass__
     assert isinstance(cls, type), callable_
-    try:
-        return _from_callable(callable_)
-    except _SignatureNotFound:
-        return _from_raw_signature(_to_raw_signature(callable_))
+    return _resolve(
+        callable_,
+        _partial(_from_callable, callable_),
+        _partial(_from_raw_callable, callable_),
+    )
 
 
-@from_callable.register(type)
-def _(_callable: Callable[..., Any], /) -> _Signature:
-    try:
-        qualified_paths = resolve_qualified_paths(_callable)
-        if not qualified_paths:
-            raise _SignatureNotFound
-        module_path, object_path = _resolve_builder_qualified_path(
-            qualified_paths
+@_from_own_callable.register(type)
+def _(_callable: type, /) -> _Signature:
+    return _resolve(
+        _callable,
+        _partial(_from_class, _callable),
+        _partial(_from_raw_class, _callable),
+    )
+
+
+@_from_own_callable.register(_partial)
+def _(_callable: _partial[Any], /) -> _Signature:
+    function, args, keywords = _flatten_partial(_callable)
+    # signature of the underlying function is shared by all its partials
+    return memoized_from_callable(function).bind(*args, **keywords)
+
+
+def _flatten_partial(
+    value: _partial[Any], /
+) -> tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]:
+    # partials with instance attributes do not get flattened on creation,
+    # while instances of subclasses are opaque like in `functools`
+    function, args, keywords = value.func, value.args, value.keywords
+    while type(function) is _partial:
+        args = function.args + args
+        keywords = {**function.keywords, **keywords}
+        function = function.func
+    return function, args, keywords
+
+
+# descriptors live as long as their classes,
+# but do not support weak references
+_STABLE_CALLABLE_TYPES: Final[tuple[type, ...]] = (
+    ()
+    if sys.implementation.name == 'pypy'
+    else (_types.MethodDescriptorType, _types.WrapperDescriptorType)
+)
+
+
+def _to_cache_sources(
+    callable_: Callable[..., Any], /
+) -> _memoization.Sources | None:
+    # signatures derived from plain functions depend on their attributes,
+    # which can be reassigned after the signature is cached
+    function = (
+        callable_.__func__
+        if isinstance(callable_, _types.MethodType)
+        else _flatten_partial(callable_)[0]
+        if isinstance(callable_, _partial)
+        else callable_
+    )
+    return (
+        _to_function_signature_sources(function)
+        if isinstance(function, _types.FunctionType)
+        else ()
+    )
+
+
+cache: Final[_memoization.WeakCache[_Signature]] = _memoization.WeakCache(
+    strongly_referenced_types=_STABLE_CALLABLE_TYPES,
+    to_sources=_to_cache_sources,
+)
+
+
+class UnsupportedCallable(ValueError):
+    def __init__(self, callable_: Callable[..., Any], /) -> None:
+        super().__init__(f'Signature of {callable_!r} is not supported.')
+
+
+@_final
+class ResolutionStrategy(_enum.Enum):
+    AUTO = 'auto'
+    INSPECT_FIRST = 'inspect_first'
+    INSPECT_ONLY = 'inspect_only'
+    STUB_FIRST = 'stub_first'
+    STUB_ONLY = 'stub_only'
+
+    def __repr__(self) -> str:
+        return type(self).__qualname__ + '.' + str(self.name)
+
+
+def get_strategy() -> ResolutionStrategy:
+    return _strategy
+
+
+def set_strategy(strategy: ResolutionStrategy, /) -> None:
+    global _strategy
+    if not isinstance(strategy, ResolutionStrategy):
+        raise TypeError(
+            f'Strategy should be an instance of {ResolutionStrategy!r}, '
+            f'but found {strategy!r}.'
         )
-        ast_nodes = _load_statement_nodes(module_path, object_path)
-        class_path, _builder_name = object_path[:-1], object_path[-1]
-        return _from_signatures(
-            *[
-                _from_statement_node(
-                    ast_node, _callable, module_path, class_path
+    if strategy is not _strategy:
+        # cached signatures may have been resolved differently
+        clear_caches()
+        _strategy = strategy
+
+
+_strategy: ResolutionStrategy = ResolutionStrategy.AUTO
+
+
+def get_unwrapping_depth() -> int:
+    return _unwrapping_depth
+
+
+def set_unwrapping_depth(max_depth: int, /) -> None:
+    global _unwrapping_depth
+    if max_depth < 0:
+        raise ValueError(
+            'Unwrapping depth should be non-negative, '
+            f'but found {max_depth!r}.'
+        )
+    if max_depth != _unwrapping_depth:
+        # cached signatures of wrappers may have been resolved differently
+        clear_caches()
+        _unwrapping_depth = max_depth
+
+
+# `__wrapped__` chains are not followed by default
+_unwrapping_depth: int = 0
+
+
+def memoized_from_callable(callable_: Callable[..., Any], /) -> _Signature:
+    result = cache.lookup(callable_)
+    if result is _MISSING:
+        result = from_callable(callable_)
+        cache.store(callable_, result)
+    return result
+
+
+def from_callables(
+    callables: Iterable[Callable[..., Any]], /
+) -> list[_Signature | Exception]:
+    callables = list(callables)
+    results: dict[int, _Signature | Exception] = {}
+    for callable_ in callables:
+        # callables are kept alive by the list, so identifiers are stable
+        callable_id = id(callable_)
+        if callable_id in results:
+            continue
+        try:
+            results[callable_id] = memoized_from_callable(callable_)
+        except Exception as error:
+            results[callable_id] = error
+    return [results[id(callable_)] for callable_ in callables]
+
+
+def from_module(
+    module: _types.ModuleType, /, *, recursive: bool
+) -> dict[str, _Signature | Exception]:
+    callables: dict[str, Callable[..., Any]] = {}
+    _collect_public_callables(
+        module,
+        callables=callables,
+        namespace_path=_catalog.path_from_string(module.__name__),
+        recursive=recursive,
+        visited_namespaces={module},
+    )
+    return dict(
+        zip(callables.keys(), from_callables(callables.values()), strict=True)
+    )
+
+
+def _collect_public_callables(
+    namespace: _namespacing.ModuleOrType,
+    /,
+    *,
+    callables: dict[str, Callable[..., Any]],
+    namespace_path: _catalog.Path,
+    recursive: bool,
+    visited_namespaces: set[_namespacing.ModuleOrType],
+) -> None:
+    is_module = isinstance(namespace, _types.ModuleType)
+    # like star imports do, modules' `__all__` is preferred if defined
+    exported_names: Container[str] | None = (
+        frozenset(vars(namespace)['__all__'])
+        if is_module and '__all__' in vars(namespace)
+        else None
+    )
+    for name in list(vars(namespace)):
+        is_exported = (
+            not name.startswith('_')
+            if exported_names is None
+            else name in exported_names
+        )
+        if not is_exported and name.startswith('_'):
+            continue
+        try:
+            value = getattr(namespace, name)
+        except AttributeError:
+            continue
+        if isinstance(value, _types.ModuleType):
+            if (
+                recursive
+                and isinstance(namespace, _types.ModuleType)
+                and value.__name__.startswith(namespace.__name__ + '.')
+                and value not in visited_namespaces
+            ):
+                visited_namespaces.add(value)
+                _collect_public_callables(
+                    value,
+                    callables=callables,
+                    namespace_path=_catalog.path_from_string(value.__name__),
+                    recursive=recursive,
+                    visited_namespaces=visited_namespaces,
                 )
-                for ast_node in ast_nodes
-            ]
+            continue
+        if not (is_exported and callable(value)):
+            continue
+        if (
+            is_module
+            and exported_names is None
+            # imported objects belong to other modules
+            and getattr(value, '__module__', None) != namespace.__name__
+        ):
+            continue
+        object_path = (*namespace_path, name)
+        callables[_catalog.path_to_string(object_path)] = value
+        if (
+            recursive
+            and isinstance(value, type)
+            and value not in visited_namespaces
+        ):
+            visited_namespaces.add(value)
+            _collect_public_callables(
+                value,
+                callables=callables,
+                namespace_path=object_path,
+                recursive=recursive,
+                visited_namespaces=visited_namespaces,
+            )
+
+
+def from_path(name: str, /) -> _Signature:
+    result = _from_stub_path(_catalog.path_from_string(name))
+    if result is _MISSING:
+        raise ValueError(f'No signature found in stubs for "{name}".')
+    return result
+
+
+def _from_stub_path(path: _catalog.Path, /) -> _Signature | _Missing:
+    resolution = _resolve_stub_path(path)
+    if resolution is _MISSING:
+        return _MISSING
+    qualified_path, is_instance_member = resolution
+    module_path, object_path = qualified_path
+    if (
+        _stubs.statement_node_kinds[module_path].get(object_path)
+        is _NodeKind.CLASS
+    ):
+        builder_qualified_path = _resolve_builder_qualified_path(
+            [qualified_path]
         )
-    except _SignatureNotFound:
-        return _from_raw_signature(
-            _to_raw_signature(_callable).replace(return_annotation=_Self)
+        return (
+            _MISSING
+            if builder_qualified_path is _MISSING
+            else _from_class_builder(builder_qualified_path)
         )
+    result = _from_qualified_paths([qualified_path], is_class=False)
+    # like bound methods, members of instances are bound to them,
+    # binding does not depend on the instance itself
+    return (
+        result.bind(_Self)
+        if is_instance_member and result is not _MISSING
+        else result
+    )
 
 
-@from_callable.register(_partial)
-def _(_callable: _partial[Any], /) -> _Signature:
-    return from_callable(_callable.func).bind(
-        *_callable.args, **_callable.keywords
+def from_type(cls: type, /) -> dict[str, _Signature | Exception]:
+    result: dict[str, _Signature | Exception] = {}
+    for name in dir(cls):
+        try:
+            member = getattr(cls, name)
+        except AttributeError:
+            continue
+        if not callable(member):
+            continue
+        # members go through the same path as standalone callables,
+        # so their signatures are consistent & shared via the cache
+        try:
+            result[name] = memoized_from_callable(member)
+        except Exception as error:
+            result[name] = error
+    return result
+
+
+def clear_caches() -> None:
+    cache.clear()
+    _instance_methods_cache.clear()
+    _builder_qualified_paths_cache.clear()
+    _class_signatures_cache.clear()
+    _qualified_paths_cache.clear()
+    _stubless_callables_cache.clear()
+    _stubless_class_methods_cache.clear()
+    _stubless_qualified_paths_cache.clear()
+    _functions_signatures_cache.clear()
+    _string_annotations_paths_cache.clear()
+    _stubbed_objects_cache.clear()
+
+
+def _from_function(
+    function: _types.FunctionType,
+    /,
+    *,
+    inspection_attributes_names: frozenset[str] = frozenset(
+        ['__partialmethod__', '__signature__', '__wrapped__', '_partialmethod']
+    ),
+) -> _Signature:
+    if not inspection_attributes_names.isdisjoint(vars(function)):
+        # signature is altered, leaving it to `inspect`
+        return _from_raw_signature(_to_raw_signature(function))
+    sources = _to_function_signature_sources(function)
+    if sources is None:
+        return _from_raw_signature(_to_raw_signature(function))
+    code = function.__code__
+    namespace = function.__globals__
+    cached_entry = _functions_signatures_cache.lookup(code)
+    if cached_entry is not _MISSING:
+        (
+            cached_namespace_id,
+            cached_namespace_owner_reference,
+            cached_sources,
+            cached_result,
+        ) = cached_entry
+        if (
+            # identifier is unique while the namespace owner is alive
+            cached_namespace_owner_reference() is not None
+            and cached_namespace_id == id(namespace)
+            and _memoization.are_identical_sources(cached_sources, sources)
+        ):
+            return cached_result
+    result = _from_function_code(function)
+    module = sys.modules.get(function.__module__)
+    # string annotations are evaluated within globals,
+    # holding which would keep alive functions defined in them,
+    # so they are identified by their owner instead
+    namespace_owner = (
+        module
+        if module is not None and vars(module) is namespace
+        else function
+    )
+    _functions_signatures_cache.store(
+        code, (id(namespace), _weakref.ref(namespace_owner), sources, result)
+    )
+    return result
+
+
+# closures created by the same definition share the code object,
+# and usually -- globals, defaults & annotations,
+# so signature is built once
+_functions_signatures_cache: Final[
+    _memoization.WeakCache[
+        tuple[int, Callable[[], Any], _memoization.Sources, _Signature]
+    ]
+] = _memoization.WeakCache()
+
+
+def _to_function_signature_sources(
+    function: _types.FunctionType, /
+) -> _memoization.Sources | None:
+    try:
+        annotations = function.__annotations__
+    except Exception:
+        # lazily evaluated annotations can refer to undefined names
+        return None
+    return (
+        function.__defaults__ or (),
+        tuple(_chain.from_iterable((function.__kwdefaults__ or {}).items())),
+        tuple(_chain.from_iterable(annotations.items())),
+        getattr(function, '__type_params__', ()),
+        # names in globals can be rebound, so evaluation results
+        # depend on values string annotations refer to
+        tuple(
+            _lookup_namespace_path(function.__globals__, path)
+            for annotation in annotations.values()
+            if isinstance(annotation, str)
+            for path in _to_string_annotation_paths(annotation)
+        ),
     )
 
 
+def _lookup_namespace_path(
+    namespace: dict[str, Any], path: _catalog.Path, /
+) -> Any:
+    name, *attributes_names = path
+    try:
+        result = namespace[name]
+    except KeyError:
+        result = getattr(_builtins, name, _MISSING)
+    for attribute_name in attributes_names:
+        if result is _MISSING:
+            break
+        try:
+            result = getattr(result, attribute_name)
+        except Exception:
+            result = _MISSING
+    return result
+
+
+def _to_string_annotation_paths(
+    annotation: str, /
+) -> tuple[_catalog.Path, ...]:
+    try:
+        return _string_annotations_paths_cache[annotation]
+    except KeyError:
+        pass
+    try:
+        expression_node = _ast.parse(annotation, mode='eval')
+    except SyntaxError:
+        # evaluation fails regardless of the namespace
+        result: tuple[_catalog.Path, ...] = ()
+    else:
+        result = tuple(
+            {
+                path: None
+                for node in _ast.walk(expression_node)
+                if (
+                    isinstance(node, _ast.Attribute | _ast.Name)
+                    and (path := _conversion.to_maybe_path(node)) is not None
+                )
+            }
+        )
+    if len(_string_annotations_paths_cache) >= _memoization.DEFAULT_MAX_SIZE:
+        # evicting the oldest entry
+        del _string_annotations_paths_cache[
+            next(iter(_string_annotations_paths_cache))
+        ]
+    _string_annotations_paths_cache[annotation] = result
+    return result
+
+
+_string_annotations_paths_cache: Final[
+    dict[str, tuple[_catalog.Path, ...]]
+] = {}
+
+
+def _from_function_code(function: _types.FunctionType, /) -> _Signature:
+    # mirrors `inspect` for plain functions
+    code = function.__code__
+    positionals_count, keywords_only_count = (
+        code.co_argcount,
+        code.co_kwonlyargcount,
+    )
+    names = code.co_varnames
+    annotations = _to_raw_annotations(function)
+    defaults = function.__defaults__ or ()
+    keywords_defaults = function.__kwdefaults__ or {}
+    required_positionals_count = positionals_count - len(defaults)
+    parameters: list[_Parameter] = []
+    for index, name in enumerate(names[:positionals_count]):
+        kind: _typing.Literal[
+            _ParameterKind.POSITIONAL_ONLY,
+            _ParameterKind.POSITIONAL_OR_KEYWORD,
+        ] = (
+            _ParameterKind.POSITIONAL_ONLY
+            if index < code.co_posonlyargcount
+            else _ParameterKind.POSITIONAL_OR_KEYWORD
+        )
+        annotation, default = (
+            annotations.get(name, Any),
+            (
+                _inspect.Parameter.empty
+                if index < required_positionals_count
+                else defaults[index - required_positionals_count]
+            ),
+        )
+        parameters.append(
+            _RequiredParameter(annotation=annotation, kind=kind, name=name)
+            if default is _inspect.Parameter.empty
+            else _OptionalParameter(
+                annotation=annotation, default=default, kind=kind, name=name
+            )
+        )
+    variadic_index = positionals_count + keywords_only_count
+    if code.co_flags & _inspect.CO_VARARGS:
+        name = names[variadic_index]
+        parameters.append(
+            _OptionalParameter(
+                annotation=annotations.get(name, Any),
+                kind=_ParameterKind.VARIADIC_POSITIONAL,
+                name=name,
+            )
+        )
+        variadic_index += 1
+    for name in names[positionals_count:][:keywords_only_count]:
+        annotation, default = (
+            annotations.get(name, Any),
+            keywords_defaults.get(name, _inspect.Parameter.empty),
+        )
+        parameters.append(
+            _OptionalParameter(
+                annotation=annotation,
+                default=default,
+                kind=_ParameterKind.KEYWORD_ONLY,
+                name=name,
+            )
+            if default is not _inspect.Parameter.empty
+            else _RequiredParameter(
+                annotation=annotation,
+                kind=_ParameterKind.KEYWORD_ONLY,
+                name=name,
+            )
+        )
+    if code.co_flags & _inspect.CO_VARKEYWORDS:
+        name = names[variadic_index]
+        parameters.append(
+            _OptionalParameter(
+                annotation=annotations.get(name, Any),
+                kind=_ParameterKind.VARIADIC_KEYWORD,
+                name=name,
+            )
+        )
+    return _PlainSignature(*parameters, returns=annotations.get('return', Any))
+
+
+# bound methods are created on each attribute access,
+# so their signatures are cached per class & method name instead
+_instance_methods_cache: Final[_memoization.AttributesCache[_Signature]] = (
+    _memoization.AttributesCache()
+)
+
+
+def _from_instance_method(
+    instance: Any, name: str, /
+) -> _Signature | _Missing:
+    cls = type(instance)
+    method = getattr(cls, name)
+    result = _instance_methods_cache.lookup(cls, name, method)
+    if result is _MISSING:
+        unbound_result = _from_callable(method)
+        if unbound_result is _MISSING:
+            return _MISSING
+        # binding does not depend on the instance itself,
+        # so bound signature can be shared by all class instances
+        result = unbound_result.bind(instance)
+        _instance_methods_cache.store(cls, name, method, result)
+    return result
+
+
 @_singledispatch
 def _from_expression_node(
     ast_node: _ast.expr,
-    _callable: Callable[..., Any],
     _module_path: _catalog.Path,
     _parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,  # noqa: ARG001
 ) -> _Signature:
     raise TypeError(ast_node)
 
@@ -172,34 +709,31 @@ def _from_expression_node(
 @_from_expression_node.register(_ast.Name)
 def _(
     ast_node: _ast.Attribute | _ast.Name,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
     *,
+    is_class: bool,
     call_name: str = object.__call__.__name__,
 ) -> _Signature:
     object_path = _conversion.to_path(ast_node)
-    module_path, object_path = _scoping.resolve_object_path(
-        module_path,
-        parent_path,
-        object_path,
-        _stubs.definitions,
-        _stubs.references,
-        _stubs.submodules,
-        _stubs.superclasses,
+    module_path, object_path = _stubs.resolve_object_path(
+        module_path, parent_path, object_path
     )
     node_kind = _stubs.statement_node_kinds[module_path][object_path]
     if node_kind is _NodeKind.CLASS:
         call_ast_nodes = _load_statement_nodes(
             module_path, (*object_path, call_name)
         )
+        if call_ast_nodes is _MISSING:
+            raise _SignatureNotFound
         call_signatures = [
-            _from_statement_node(ast_node, callable_, module_path, ())
+            _from_statement_node(ast_node, module_path, (), is_class=is_class)
             for ast_node in call_ast_nodes
         ]
         return _from_signatures(
-            *[signature.bind(callable_) for signature in call_signatures]
+            # binding does not depend on the instance itself
+            *[signature.bind(_Self) for signature in call_signatures]
         )
     annotation_nodes = _stubs.statement_nodes[module_path][object_path]
     if len(annotation_nodes) == 1:
@@ -209,7 +743,7 @@ def _(
             object_path,
         )
         return _from_statement_node(
-            annotation_node, callable_, module_path, ()
+            annotation_node, module_path, (), is_class=is_class
         )
     raise _SignatureNotFound
 
@@ -217,11 +751,11 @@ def _(
 @_from_expression_node.register(_ast.Call)
 def _(
     ast_node: _ast.Call,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
     *,
+    is_class: bool,
     type_var_object_path: _catalog.Path = _catalog.path_from_string(  # noqa: B008
         TypeVar.__qualname__
     ),
@@ -230,14 +764,8 @@ def _(
     ),
 ) -> _Signature:
     callable_object_path = _conversion.to_path(ast_node.func)
-    callable_module_path, callable_object_path = _scoping.resolve_object_path(
-        module_path,
-        parent_path,
-        callable_object_path,
-        _stubs.definitions,
-        _stubs.references,
-        _stubs.submodules,
-        _stubs.superclasses,
+    callable_module_path, callable_object_path = _stubs.resolve_object_path(
+        module_path, parent_path, callable_object_path
     )
     if (
         callable_module_path == typing_module_path
@@ -255,14 +783,17 @@ def _(
             _from_signatures(
                 *[
                     _from_expression_node(
-                        argument, callable_, module_path, parent_path
+                        argument, module_path, parent_path, is_class=is_class
                     )
                     for argument in ast_node.args[1:]
                 ]
             )
             if maybe_bound_type_node is None
             else _from_expression_node(
-                maybe_bound_type_node, callable_, module_path, parent_path
+                maybe_bound_type_node,
+                module_path,
+                parent_path,
+                is_class=is_class,
             )
         )
     raise _SignatureNotFound
@@ -271,25 +802,19 @@ def _(
 @_from_expression_node.register(_ast.Subscript)
 def _(
     ast_node: _ast.Subscript,
-    _callable: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
     *,
+    is_class: bool,  # noqa: ARG001
     callable_object_path: _catalog.Path = ('Callable',),
     typing_module_path: _catalog.Path = _catalog.module_path_from_module(  # noqa: B008
         _typing
     ),
 ) -> _Signature:
     value_path = _conversion.to_path(ast_node.value)
-    value_module_path, value_object_path = _scoping.resolve_object_path(
-        module_path,
-        parent_path,
-        value_path,
-        _stubs.definitions,
-        _stubs.references,
-        _stubs.submodules,
-        _stubs.superclasses,
+    value_module_path, value_object_path = _stubs.resolve_object_path(
+        module_path, parent_path, value_path
     )
     if (
         value_module_path == typing_module_path
@@ -342,10 +867,11 @@ def _(
 @_singledispatch
 def _from_statement_node(
     ast_node: _ast.stmt,
-    _callable: Callable[..., Any],
     _module_path: _catalog.Path,
     _parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,  # noqa: ARG001
 ) -> _Signature:
     raise TypeError(ast_node)
 
@@ -353,29 +879,31 @@ def _from_statement_node(
 @_from_statement_node.register(_ast.AnnAssign)
 def _(
     ast_node: _ast.AnnAssign,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,
 ) -> _Signature:
     return _from_expression_node(
         (ast_node.annotation if ast_node.value is None else ast_node.value),
-        callable_,
         module_path,
         parent_path,
+        is_class=is_class,
     )
 
 
 @_from_statement_node.register(_ast.Assign)
 def _(
     ast_node: _ast.Assign,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,
 ) -> _Signature:
     return _from_expression_node(
-        ast_node.value, callable_, module_path, parent_path
+        ast_node.value, module_path, parent_path, is_class=is_class
     )
 
 
@@ -383,26 +911,28 @@ def _(
 @_from_statement_node.register(_ast.FunctionDef)
 def _(
     ast_node: _ast.AsyncFunctionDef | _ast.FunctionDef,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,
 ) -> _Signature:
     parameters = _parameters_from(
-        ast_node, callable_, module_path, parent_path
+        ast_node, module_path, parent_path, is_class=is_class
     )
     returns = _return_annotation_from(
-        ast_node, callable_, module_path, parent_path
+        ast_node, module_path, parent_path, is_class=is_class
     )
     return _PlainSignature(*parameters, returns=returns)
 
 
 def _parameters_from(
     ast_node: _ast.AsyncFunctionDef | _ast.FunctionDef,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
+    *,
+    is_class: bool,
 ) -> list[_Parameter]:
     signature_ast = ast_node.args
     result: list[_Parameter] = list(
@@ -424,7 +954,7 @@ def _parameters_from(
             ),
         )
     )
-    if isinstance(callable_, type):
+    if is_class:
         del result[0]
     elif any(
         _is_classmethod(decorator_node, module_path, parent_path)
@@ -449,17 +979,17 @@ def _parameters_from(
 
 def _return_annotation_from(
     ast_node: _ast.AsyncFunctionDef | _ast.FunctionDef,
-    callable_: Callable[..., Any],
     module_path: _catalog.Path,
     parent_path: _catalog.Path,
     /,
     *,
+    is_class: bool,
     initializer_name: str = object.__init__.__name__,
 ) -> Any:
     return_node = ast_node.returns
     return (
         _Self
-        if (isinstance(callable_, type) and ast_node.name == initializer_name)
+        if (is_class and ast_node.name == initializer_name)
         else (
             Any
             if return_node is None
@@ -484,15 +1014,7 @@ def _is_classmethod(
     maybe_path = _conversion.to_maybe_path(expression_node)
     return (
         maybe_path is not None
-        and _scoping.resolve_object_path(
-            module_path,
-            parent_path,
-            maybe_path,
-            _stubs.definitions,
-            _stubs.references,
-            _stubs.submodules,
-            _stubs.superclasses,
-        )
+        and _stubs.resolve_object_path(module_path, parent_path, maybe_path)
         == classmethod_qualified_path
     )
 
@@ -501,37 +1023,401 @@ class _SignatureNotFound(Exception):
     pass
 
 
+def _resolve_stub_path(
+    path: _catalog.Path,
+    /,
+    *,
+    builtins_module_path: _catalog.Path = _catalog.module_path_from_module(  # noqa: B008
+        _builtins
+    ),
+) -> tuple[_catalog.QualifiedPath, bool] | _Missing:
+    if len(path) == 1:
+        # like in runtime, unqualified names are built-ins
+        return _resolve_stub_object_path(builtins_module_path, path)
+    # the longest prefix with stubs is the module,
+    # like in runtime where submodules shadow package attributes
+    for module_path_length in range(len(path) - 1, 0, -1):
+        module_path = path[:module_path_length]
+        if _sources.lookup(module_path) is not _MISSING:
+            return _resolve_stub_object_path(
+                module_path, path[module_path_length:]
+            )
+    return _MISSING
+
+
+def _resolve_stub_object_path(
+    module_path: _catalog.Path, object_path: _catalog.Path, /
+) -> tuple[_catalog.QualifiedPath, bool] | _Missing:
+    # gives the qualified path along with the flag
+    # whether the object is a member of a module-level instance
+    visited_qualified_paths: set[_catalog.QualifiedPath] = set()
+    while (module_path, object_path) not in visited_qualified_paths:
+        visited_qualified_paths.add((module_path, object_path))
+        result = _stubs.lookup_object_path(module_path, (), object_path)
+        if result is not _MISSING:
+            return result, False
+        for prefix_length in range(len(object_path) - 1, 0, -1):
+            prefix_qualified_path = _stubs.lookup_object_path(
+                module_path, (), object_path[:prefix_length]
+            )
+            if prefix_qualified_path is _MISSING:
+                continue
+            # like for bound methods, members of instances
+            # are looked up in their classes
+            class_qualified_path = _to_instance_class_qualified_path(
+                prefix_qualified_path
+            )
+            if class_qualified_path is _MISSING:
+                return _MISSING
+            class_module_path, class_object_path = class_qualified_path
+            member_qualified_path = _stubs.lookup_object_path(
+                class_module_path,
+                (),
+                class_object_path + object_path[prefix_length:],
+            )
+            return (
+                _MISSING
+                if member_qualified_path is _MISSING
+                else (member_qualified_path, True)
+            )
+        # referents of assignments like `name = instance.attribute`
+        # are not objects, so they are resolved by the same rules
+        module_references = _stubs.references.get(module_path, {})
+        for prefix_length in range(len(object_path), 0, -1):
+            reference = module_references.get(object_path[:prefix_length])
+            if reference is not None:
+                referent_module_path, referent_object_path = reference
+                module_path, object_path = (
+                    referent_module_path,
+                    referent_object_path + object_path[prefix_length:],
+                )
+                break
+        else:
+            return _MISSING
+    # cyclic references
+    return _MISSING
+
+
+def _to_instance_class_qualified_path(
+    qualified_path: _catalog.QualifiedPath, /
+) -> _catalog.QualifiedPath | _Missing:
+    module_path, object_path = qualified_path
+    if (
+        _stubs.statement_node_kinds[module_path].get(object_path)
+        is not _NodeKind.ANNOTATED_ASSIGNMENT
+    ):
+        return _MISSING
+    (ast_node,) = _stubs.statement_nodes[module_path][object_path]
+    assert isinstance(ast_node, _ast.AnnAssign), qualified_path
+    annotation_path = _conversion.to_maybe_path(ast_node.annotation)
+    if annotation_path is None:
+        return _MISSING
+    result = _stubs.lookup_object_path(
+        module_path, object_path[:-1], annotation_path
+    )
+    return (
+        result
+        if (
+            result is not _MISSING
+            and _stubs.statement_node_kinds[result[0]].get(result[1])
+            is _NodeKind.CLASS
+        )
+        else _MISSING
+    )
+
+
 def _try_resolve_object_path(
     module_path: _catalog.Path, object_path: _catalog.Path, /
 ) -> _catalog.QualifiedPath:
+    result = _stubs.lookup_object_path(module_path, (), object_path)
+    return ((), ()) if result is _MISSING else result
+
+
+def _from_class_builder(
+    builder_qualified_path: _catalog.QualifiedPath, /
+) -> _Signature | _Missing:
+    cached_result = _class_signatures_cache.get(builder_qualified_path)
+    if cached_result is not None:
+        return cached_result
+    module_path, object_path = builder_qualified_path
+    ast_nodes = _load_statement_nodes(module_path, object_path)
+    if ast_nodes is _MISSING:
+        return _MISSING
+    class_path, _builder_name = object_path[:-1], object_path[-1]
     try:
-        return _scoping.resolve_object_path(
-            module_path,
-            (),
-            object_path,
-            _stubs.definitions,
-            _stubs.references,
-            _stubs.submodules,
-            _stubs.superclasses,
+        signatures = [
+            _from_statement_node(
+                ast_node, module_path, class_path, is_class=True
+            )
+            for ast_node in ast_nodes
+        ]
+    except _SignatureNotFound:
+        return _MISSING
+    # class signature depends on its builder only,
+    # so classes sharing the builder share the signature
+    result = _class_signatures_cache[builder_qualified_path] = (
+        _from_signatures(*signatures)
+    )
+    return result
+
+
+def _resolve(
+    callable_: Callable[..., Any],
+    from_stubs: Callable[[], _Signature | _Missing],
+    from_runtime: Callable[[], _Signature],
+    /,
+) -> _Signature:
+    qualified_path = _to_lookup_qualified_path(callable_)
+    strategy = _to_strategy(qualified_path)
+    if strategy is ResolutionStrategy.INSPECT_ONLY:
+        return from_runtime()
+    if strategy is ResolutionStrategy.INSPECT_FIRST:
+        try:
+            return from_runtime()
+        except Exception as error:
+            if _is_stubless(qualified_path):
+                # stubs lookup is bound to miss
+                raise
+            try:
+                result = from_stubs()
+            except Exception:
+                # original failure is the one to report
+                result = _MISSING
+            if result is _MISSING:
+                raise error from None
+            return result
+    if _is_stubless(qualified_path):
+        # stubs lookup is bound to miss
+        if strategy is ResolutionStrategy.STUB_ONLY:
+            raise UnsupportedCallable(callable_)
+        return from_runtime()
+    result = from_stubs()
+    if result is not _MISSING:
+        return result
+    if strategy is ResolutionStrategy.STUB_ONLY:
+        raise ValueError(f'No signature found in stubs for {callable_!r}.')
+    return from_runtime()
+
+
+def _unwrap(
+    callable_: Callable[..., Any], max_depth: int, /
+) -> Callable[..., Any]:
+    result = cursor = callable_
+    visited_ids = {id(cursor)}
+    # the whole chain is walked to detect loops like `inspect.unwrap` does,
+    # since `inspect` machinery can follow wrappers beyond the depth
+    while True:
+        # like in `inspect`, explicit signatures stop unwrapping
+        if hasattr(cursor, '__signature__'):
+            break
+        wrapped = getattr(cursor, '__wrapped__', None)
+        if not callable(wrapped):
+            break
+        cursor = wrapped
+        if id(cursor) in visited_ids:
+            raise ValueError(f'wrapper loop when unwrapping {callable_!r}')
+        if len(visited_ids) <= max_depth:
+            result = cursor
+        visited_ids.add(id(cursor))
+    return result
+
+
+def _to_lookup_qualified_path(
+    callable_: Callable[..., Any], /
+) -> _catalog.QualifiedPath:
+    # classes can have `__self__` attribute as well, e.g. `super`
+    self = (
+        None
+        if isinstance(callable_, type)
+        else getattr(callable_, '__self__', None)
+    )
+    if self is None or isinstance(self, (_types.ModuleType, type)):
+        return _catalog.qualified_path_from(callable_)
+    # methods bound to instances are looked up in classes defining them,
+    # e.g. stdlib ones for methods of application subclasses instances
+    name = callable_.__name__
+    cls = type(self)
+    defining_cls = next(
+        (base for base in cls.__mro__ if name in vars(base)), cls
+    )
+    class_module_path, class_object_path = _catalog.qualified_path_from(
+        defining_cls
+    )
+    return class_module_path, (*class_object_path, name)
+
+
+def _to_strategy(
+    qualified_path: _catalog.QualifiedPath, /
+) -> ResolutionStrategy:
+    if _strategy is not ResolutionStrategy.AUTO:
+        return _strategy
+    # stubs lookups are bound to miss for callables
+    # from modules without stubs definitions, e.g. application ones
+    module_path, object_path = qualified_path
+    return (
+        ResolutionStrategy.STUB_FIRST
+        if _is_stubbed(module_path, object_path[:1])
+        else ResolutionStrategy.INSPECT_FIRST
+    )
+
+
+def _is_stubbed(
+    module_path: _catalog.Path, object_path: _catalog.Path, /
+) -> bool:
+    cached_result = _stubbed_objects_cache.get((module_path, object_path))
+    if cached_result is not None:
+        return cached_result
+    module = sys.modules.get(_catalog.path_to_string(module_path))
+    result = _stubbed_objects_cache[module_path, object_path] = (
+        module is not None and _is_stdlib_module(module)
+    ) or _has_stubs_definition(module_path, object_path)
+    return result
+
+
+_stubbed_objects_cache: Final[dict[_catalog.QualifiedPath, bool]] = {}
+
+
+def _has_stubs_definition(
+    module_path: _catalog.Path, object_path: _catalog.Path, /
+) -> bool:
+    return (
+        _sources.lookup(module_path) is not _MISSING
+        and _stubs.lookup_object_path(module_path, (), object_path)
+        is not _MISSING
+    )
+
+
+def _is_stubless(qualified_path: _catalog.QualifiedPath, /) -> bool:
+    generation = _qualified_paths.generation
+    cached_entry = _stubless_qualified_paths_cache.get(qualified_path)
+    if cached_entry is not None:
+        cached_generation, cached_result = cached_entry
+        # newly processed modules can add candidates
+        if cached_generation == generation:
+            return cached_result
+    module_path, object_path = qualified_path
+    try:
+        _qualified_paths[module_path][object_path]
+    except KeyError:
+        # without candidates the qualified path itself is looked up
+        result = not module_path or not _has_stubs_definition(
+            module_path, object_path
         )
-    except _scoping.ObjectNotFound:
-        return (), ()
+    else:
+        # candidates are filtered by the object itself
+        result = False
+    _stubless_qualified_paths_cache[qualified_path] = generation, result
+    return result
+
+
+# qualified paths which stubs lookups are bound to miss for,
+# along with the generation of candidates they were checked against
+_stubless_qualified_paths_cache: Final[
+    dict[_catalog.QualifiedPath, tuple[int, bool]]
+] = {}
+
+
+def _from_class(cls: type, /) -> _Signature | _Missing:
+    qualified_paths = resolve_qualified_paths(cls)
+    if not qualified_paths:
+        return _MISSING
+    builder_qualified_path = _resolve_builder_qualified_path(qualified_paths)
+    return (
+        _MISSING
+        if builder_qualified_path is _MISSING
+        else _from_class_builder(builder_qualified_path)
+    )
 
 
-def _from_callable(value: Callable[..., Any], /) -> _Signature:
-    for module_path, object_path in _to_qualified_paths(value):
+def _from_raw_callable(callable_: Callable[..., Any], /) -> _Signature:
+    return _from_raw_signature(_to_raw_signature(callable_))
+
+
+def _from_raw_class(cls: type, /) -> _Signature:
+    return _from_raw_signature(
+        _to_raw_signature(cls).replace(return_annotation=_Self)
+    )
+
+
+def _from_callable(value: Callable[..., Any], /) -> _Signature | _Missing:
+    qualified_paths = tuple(_to_qualified_paths(value))
+    # candidates can change with imported modules,
+    # so stubs miss is remembered along with them
+    class_method_entry = _to_class_method_entry(value)
+    if (
+        _stubless_callables_cache.lookup(value)
+        if class_method_entry is None
+        else _stubless_class_methods_cache.lookup(*class_method_entry)
+    ) == qualified_paths:
+        return _MISSING
+    result = _from_qualified_paths(
+        qualified_paths, is_class=isinstance(value, type)
+    )
+    if result is _MISSING:
+        if class_method_entry is None:
+            _stubless_callables_cache.store(value, qualified_paths)
+        else:
+            _stubless_class_methods_cache.store(
+                *class_method_entry, qualified_paths
+            )
+    return result
+
+
+# callables without usable stubs signatures
+# along with qualified paths they were looked up by
+_stubless_callables_cache: Final[
+    _memoization.WeakCache[tuple[_catalog.QualifiedPath, ...]]
+] = _memoization.WeakCache(strongly_referenced_types=_STABLE_CALLABLE_TYPES)
+# methods bound to classes are created on each attribute access,
+# so their stubs misses are remembered per class & method name instead
+_stubless_class_methods_cache: Final[
+    _memoization.AttributesCache[tuple[_catalog.QualifiedPath, ...]]
+] = _memoization.AttributesCache()
+
+
+def _to_class_method_entry(
+    value: Callable[..., Any], /
+) -> tuple[type, str, Any] | None:
+    cls = getattr(value, '__self__', None)
+    if not isinstance(cls, type) or not isinstance(
+        value, (_types.BuiltinMethodType, _types.MethodType)
+    ):
+        return None
+    name = value.__name__
+    if isinstance(value, _types.MethodType):
+        # the function is what stubs lookup depends on
+        return cls, name, value.__func__
+    # built-in methods have no underlying functions exposed,
+    # so the class attribute they are produced from is used instead
+    for base in cls.__mro__:
+        try:
+            return cls, name, vars(base)[name]
+        except KeyError:
+            continue
+    # e.g. method of the metaclass, which lives as long as it
+    return cls, name, type(cls)
+
+
+def _from_qualified_paths(
+    qualified_paths: Iterable[_catalog.QualifiedPath], /, *, is_class: bool
+) -> _Signature | _Missing:
+    for module_path, object_path in qualified_paths:
         nodes = _load_statement_nodes(module_path, object_path)
+        if nodes is _MISSING:
+            return _MISSING
         parent_path = object_path[:-1]
         try:
             signatures = [
-                _from_statement_node(node, value, module_path, parent_path)
+                _from_statement_node(
+                    node, module_path, parent_path, is_class=is_class
+                )
                 for node in nodes
             ]
         except _SignatureNotFound:
             continue
         else:
             return _from_signatures(*signatures)
-    raise _SignatureNotFound(value)
+    return _MISSING
 
 
 def _to_qualified_paths(
@@ -544,7 +1430,11 @@ def _to_qualified_paths(
             _stubs.statement_node_kinds[module_path][object_path]
             is _NodeKind.CLASS
         ):
-            yield _resolve_builder_qualified_path(qualified_paths)
+            builder_qualified_path = _resolve_builder_qualified_path(
+                qualified_paths
+            )
+            if builder_qualified_path is not _MISSING:
+                yield builder_qualified_path
         else:
             yield from qualified_paths
 
@@ -563,49 +1453,101 @@ def _resolve_builder_qualified_path(
     object_builder_qualified_path: _catalog.QualifiedPath = (
         _OBJECT_BUILDER_QUALIFIED_PATH
     ),
-) -> _catalog.QualifiedPath:
+) -> _catalog.QualifiedPath | _Missing:
+    key = tuple(qualified_paths)
+    result = _builder_qualified_paths_cache.get(key)
+    if result is None:
+        result = _builder_qualified_paths_cache[key] = (
+            _to_builder_qualified_path(
+                qualified_paths,
+                object_builder_qualified_path=object_builder_qualified_path,
+            )
+        )
+    return result
+
+
+_builder_qualified_paths_cache: Final[
+    dict[tuple[_catalog.QualifiedPath, ...], _catalog.QualifiedPath | _Missing]
+] = {}
+_class_signatures_cache: Final[dict[_catalog.QualifiedPath, _Signature]] = {}
+
+
+def _to_builder_qualified_path(
+    qualified_paths: Sequence[_catalog.QualifiedPath],
+    /,
+    *,
+    object_builder_qualified_path: _catalog.QualifiedPath,
+) -> _catalog.QualifiedPath | _Missing:
     candidates = set(
         starmap(_to_class_builder_qualified_path, qualified_paths)
     )
-    try:
-        ((module_path, object_path),) = candidates
-    except ValueError:
-        try:
-            candidates.remove(object_builder_qualified_path)
-            ((module_path, object_path),) = candidates
-        except (KeyError, ValueError):
-            raise _SignatureNotFound from None
-    return module_path, object_path
+    if len(candidates) > 1:
+        candidates.discard(object_builder_qualified_path)
+    if len(candidates) != 1:
+        return _MISSING
+    (result,) = candidates
+    return result
 
 
 def _load_statement_nodes(
     module_path: _catalog.Path, object_path: _catalog.Path, /
-) -> Sequence[_ast.stmt]:
-    try:
-        nodes = _stubs.statement_nodes[module_path][object_path]
-    except KeyError:
-        raise _SignatureNotFound from None
-    else:
-        assert len(nodes) > 0, (module_path, object_path)
-        return nodes
+) -> Sequence[_ast.stmt] | _Missing:
+    module_nodes = _stubs.statement_nodes.get(module_path)
+    if module_nodes is None:
+        return _MISSING
+    nodes = module_nodes.get(object_path)
+    if nodes is None:
+        return _MISSING
+    assert len(nodes) > 0, (module_path, object_path)
+    return nodes
 
 
 def resolve_qualified_paths(
     value: Callable[..., Any], /
 ) -> list[_catalog.QualifiedPath]:
     module_path, object_path = _catalog.qualified_path_from(value)
+    try:
+        (
+            cached_value_reference,
+            cached_generation,
+            cached_modules,
+            cached_result,
+        ) = _qualified_paths_cache[module_path, object_path]
+    except KeyError:
+        pass
+    else:
+        if (
+            cached_value_reference() is value
+            # newly processed modules can add candidates
+            and cached_generation == _qualified_paths.generation
+            and all(
+                sys.modules.get(module_name) is module
+                for module_name, module in cached_modules
+            )
+        ):
+            return list(cached_result)
+    generation = _qualified_paths.generation
     try:
         candidate_paths = _qualified_paths[module_path][object_path]
     except KeyError:
         assert not module_path or object_path, value
         qualified_paths = [(module_path, object_path)] if module_path else []
+        modules: tuple[tuple[str, _types.ModuleType | None], ...] = ()
     else:
         qualified_paths = [
             path
             for path in candidate_paths
             if _value_has_qualified_path(value, path)
         ]
-    return sorted(
+        # candidates filtering depends on imported modules
+        modules = tuple(
+            (module_name, sys.modules.get(module_name))
+            for module_name in {
+                _catalog.path_to_string(candidate_module_path)
+                for candidate_module_path, _ in candidate_paths
+            }
+        )
+    result = sorted(
         {
             (module_path, object_path)
             for module_path, object_path in list(
@@ -614,6 +1556,30 @@ def resolve_qualified_paths(
             if module_path and object_path
         }
     )
+    value_reference = _memoization.to_maybe_reference(
+        value, strongly_referenced_types=_STABLE_CALLABLE_TYPES
+    )
+    if value_reference is not None:
+        _qualified_paths_cache[module_path, object_path] = (
+            value_reference,
+            generation,
+            modules,
+            tuple(result),
+        )
+    return result
+
+
+_qualified_paths_cache: Final[
+    dict[
+        _catalog.QualifiedPath,
+        tuple[
+            Callable[[], Any],
+            int,
+            tuple[tuple[str, _types.ModuleType | None], ...],
+            tuple[_catalog.QualifiedPath, ...],
+        ],
+    ]
+] = {}
 
 
 def _to_class_builder_qualified_path(
@@ -627,7 +1593,7 @@ def _to_class_builder_qualified_path(
     constructor_name: str = object.__new__.__name__,
     initializer_name: str = object.__init__.__name__,
 ) -> _catalog.QualifiedPath:
-    for base_module_path, _base_object_path in _to_mro(
+    for base_module_path, _base_object_path in _stubs.resolve_mro(
         module_path, object_path
     ):
         base_module_annotations = _stubs.statement_nodes[base_module_path]
@@ -640,19 +1606,6 @@ def _to_class_builder_qualified_path(
     return object_builder_qualified_path
 
 
-def _to_mro(
-    module_path: _catalog.Path, object_path: _catalog.Path, /
-) -> Iterable[_catalog.QualifiedPath]:
-    yield (module_path, object_path)
-    try:
-        bases = _stubs.superclasses[module_path][object_path]
-    except KeyError:
-        return
-    else:
-        for base_module_path, base_object_path in bases:
-            yield from _to_mro(base_module_path, base_object_path)
-
-
 def _value_has_qualified_path(
     value: Any, path: _catalog.QualifiedPath, /
 ) -> bool:
@@ -784,18 +1737,38 @@ def _to_positional_parameters(
 if sys.version_info >= (3, 14):
     import annotationlib as _annotationlib
 
+    def _to_raw_annotations(
+        function: _types.FunctionType, /
+    ) -> dict[str, Any]:
+        return _annotationlib.get_annotations(
+            function, format=_annotationlib.Format.FORWARDREF
+        )
+
     def _to_raw_signature(
         callable_: Callable[..., Any], /
     ) -> _inspect.Signature:
         return _inspect.signature(
-            callable_, annotation_format=_annotationlib.Format.FORWARDREF
+            callable_,
+            annotation_format=_annotationlib.Format.FORWARDREF,
+            # opted-in unwrapping stops at its depth
+            follow_wrapped=not _unwrapping_depth,
         )
 else:
 
+    def _to_raw_annotations(
+        function: _types.FunctionType, /
+    ) -> dict[str, Any]:
+        return _inspect.get_annotations(function, eval_str=True)
+
     def _to_raw_signature(
         callable_: Callable[..., Any], /
     ) -> _inspect.Signature:
-        return _inspect.signature(callable_, eval_str=True)
+        return _inspect.signature(
+            callable_,
+            eval_str=True,
+            # opted-in unwrapping stops at its depth
+            follow_wrapped=not _unwrapping_depth,
+        )
 
 
 def _to_variadic_keyword_parameter(
@@ -9,6 +9,7 @@ from pathlib import Path as _Path
 from typing import Final, TypeAlias
 
 from . import catalog, file_system
+from .utils import MISSING, Missing
 
 _STUB_SUFFIX: Final[str] = '.pyi'
 
@@ -20,16 +21,15 @@ class NotFound(Exception):
 
 
 def from_module_path(module_path: catalog.Path, /) -> Path:
-    try:
-        return _stub_cache[module_path]
-    except KeyError as error:
-        raise NotFound(module_path) from error
+    result = lookup(module_path)
+    if result is MISSING:
+        raise NotFound(module_path)
+    return result
 
 
 def is_package(module_path: catalog.Path, /) -> bool:
-    try:
-        source_path = from_module_path(module_path)
-    except NotFound:
+    source_path = lookup(module_path)
+    if source_path is MISSING:
         spec = find_spec(catalog.path_to_string(module_path))
         if spec is None or spec.origin is None:
             return False
@@ -37,6 +37,10 @@ def is_package(module_path: catalog.Path, /) -> bool:
     return source_path.stem == file_system.INIT_MODULE_NAME
 
 
+def lookup(module_path: catalog.Path, /) -> Path | Missing:
+    return _stub_cache.get(module_path, MISSING)
+
+
 def _find_source_path(module_name: str, /) -> Path:
     maybe_spec = find_spec(module_name)
     assert maybe_spec is not None
@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast as _ast
 import builtins as _builtins
 import sys
+import threading as _threading
 import typing as _typing
 from collections.abc import (
     Callable as _Callable,
@@ -14,7 +15,7 @@ from collections.abc import (
 from copy import deepcopy as _deepcopy
 from functools import singledispatch as _singledispatch
 from importlib import import_module as _import_module
-from itertools import chain as _chain
+from itertools import chain as _chain, starmap as _starmap
 from pathlib import Path as _Path
 from typing import (
     Any as _Any,
@@ -23,6 +24,7 @@ from typing import (
     TypeAlias as _TypeAlias,
     TypeGuard as _TypeGuard,
     TypeVar as _TypeVar,
+    overload as _overload,
 )
 
 import mypy as _mypy
@@ -31,7 +33,6 @@ from mypy.version import __version__ as _mypy_version
 from typing_extensions import override as _override
 
 import paradigm
-from paradigm import __version__ as _version
 
 from . import (
     caching as _caching,
@@ -69,9 +70,31 @@ _CACHE_ROOT_DIRECTORY_PATH: _Final[_Path] = (
     _Path.home()
     / '.cache'
     / paradigm.__name__
+    / _caching.LAYOUT_DIRECTORY_NAME
     / (_CACHE_ROOT_DIRECTORY_NAME_PREFIX + '_' + _Path(__file__).stem)
 )
 _CACHE_ROOT_DIRECTORY_PATH.mkdir(exist_ok=True, parents=True)
+# stubs contents are evaluated against this context only,
+# so parsing results can be shared between interpreters
+# which differ in any other aspect (e.g. patch version or ``mypy`` version)
+_EVALUATION_CONTEXT: _Final[str] = (
+    sys.implementation.name
+    + '_'
+    + sys.platform
+    + '_'
+    + '_'.join(map(str, sys.version_info[:2]))
+)
+_OBJECTS_ROOT_DIRECTORY_PATH: _Final[_Path] = (
+    _Path.home()
+    / '.cache'
+    / paradigm.__name__
+    / _caching.LAYOUT_DIRECTORY_NAME
+    / 'objects'
+)
+
+
+class _ManifestFieldName:
+    DIGEST = 'digest'
 
 
 class _GenericFieldName:
@@ -81,27 +104,56 @@ class _GenericFieldName:
     RAW_STATEMENT_NODES = 'raw_statement_nodes'
     RAW_STATEMENT_NODE_KINDS = 'raw_statement_node_kinds'
     REFERENCES = 'references'
+    SCHEMA_VERSION = 'schema_version'
     SUBMODULES = 'submodules'
-    VERSION = 'version'
+
+
+class _MembersFieldName:
+    MEMBERS = 'members'
+    SCHEMA_VERSION = 'schema_version'
 
 
 class _SpecializedFieldName:
     DEFINITIONS = 'definitions'
     REFERENCES = 'references'
+    SCHEMA_VERSION = 'schema_version'
     SPECIALIZATION_RAW_STATEMENT_NODES = 'specialization_raw_statement_nodes'
     SPECIALIZATION_RAW_STATEMENT_NODE_KINDS = (
         'specialization_raw_statement_node_kinds'
     )
     SUPERCLASSES = 'superclasses'
-    VERSION = 'version'
 
 
+class _SymbolsFieldName:
+    SCHEMA_VERSION = 'schema_version'
+    SYMBOLS = 'symbols'
+
+
+# objects are keyed by their inputs only (stubs contents & context),
+# so these should be bumped on each change of the corresponding fields
+# layout or of parsing logic changing their values,
+# older entries get rebuilt unless there is a migration
+# registered for their schema version (upgrading it by one),
+# specialized entries are derived from the generic ones,
+# so generic schema bump requires the specialized one as well
+_GENERIC_SCHEMA_VERSION: _Final[int] = 1
+_GENERIC_SCHEMA_MIGRATIONS: _Final[_Mapping[int, _caching.Migration]] = {}
+_MEMBERS_SCHEMA_VERSION: _Final[int] = 1
+_MEMBERS_SCHEMA_MIGRATIONS: _Final[_Mapping[int, _caching.Migration]] = {}
+_SPECIALIZED_SCHEMA_VERSION: _Final[int] = 1
+_SPECIALIZED_SCHEMA_MIGRATIONS: _Final[_Mapping[int, _caching.Migration]] = {}
+_SYMBOLS_SCHEMA_VERSION: _Final[int] = 1
+_SYMBOLS_SCHEMA_MIGRATIONS: _Final[_Mapping[int, _caching.Migration]] = {}
+
 _ObjectStatementNodes: _TypeAlias = list[_ast.stmt]
 _ModuleRawNodes: _TypeAlias = dict[_catalog.Path, list[_conversion.RawNode]]
 _ModuleReferences: _TypeAlias = dict[_catalog.Path, _catalog.QualifiedPath]
 _ModuleStatementNodes: _TypeAlias = dict[_catalog.Path, _ObjectStatementNodes]
 _ModuleStatementNodeKinds: _TypeAlias = dict[_catalog.Path, _StatementNodeKind]
 _ModuleSubmodules: _TypeAlias = list[_catalog.Path]
+_ClassMembers: _TypeAlias = dict[str, _catalog.QualifiedPath]
+_ModuleMembers: _TypeAlias = dict[_catalog.Path, _ClassMembers]
+_ModuleSymbols: _TypeAlias = dict[_catalog.Path, _catalog.QualifiedPath]
 _ModuleSuperclasses: _TypeAlias = dict[
     _catalog.Path, list[_catalog.QualifiedPath]
 ]
@@ -208,16 +260,24 @@ _T_co = _TypeVar('_T_co', covariant=True)
 
 
 class _LazyMappingWrapper(_Mapping[_catalog.Path, _T_co]):
+    @_overload
+    def get(self, module_path: _catalog.Path, /) -> _T_co | None: ...
+
+    @_overload
+    def get(
+        self, module_path: _catalog.Path, default: _T_co | _T, /
+    ) -> _T_co | _T: ...
+
+    @_override
+    def get(self, module_path: _catalog.Path, default: _Any = None, /) -> _Any:
+        result = self._lookup(module_path)
+        return default if result is _MISSING else result
+
     def __getitem__(self, module_path: _catalog.Path, /) -> _T_co:
-        try:
-            return self._wrapped[module_path]
-        except KeyError as error:
-            try:
-                source_path = _sources.from_module_path(module_path)
-            except _sources.NotFound:
-                raise error from None
-            self._loader(source_path, module_path, self._state)
-            return self._wrapped[module_path]
+        result = self._lookup(module_path)
+        if result is _MISSING:
+            raise KeyError(module_path)
+        return result
 
     def __init__(
         self,
@@ -235,34 +295,79 @@ class _LazyMappingWrapper(_Mapping[_catalog.Path, _T_co]):
     def __len__(self, /) -> int:
         return len(self._wrapped)
 
+    def _lookup(self, module_path: _catalog.Path, /) -> _T_co | _Missing:
+        result = self._wrapped.get(module_path, _MISSING)
+        if result is not _MISSING:
+            return result
+        source_path = _sources.lookup(module_path)
+        if source_path is _MISSING:
+            return _MISSING
+        state = self._state
+        with state.loading_lock:
+            loaded_modules_counts = (
+                len(state.module_definitions),
+                len(state.module_superclasses),
+            )
+            self._loader(source_path, module_path, state)
+            if loaded_modules_counts != (
+                len(state.module_definitions),
+                len(state.module_superclasses),
+            ):
+                # resolutions might change with new modules
+                state.resolved_object_paths.clear()
+            # loaders do not populate entries for all modules,
+            # e.g. only packages have submodules
+            return self._wrapped.get(module_path, _MISSING)
+
 
 class _State:
     all_module_paths: _Collection[_catalog.Path]
+    class_mros: dict[
+        _catalog.QualifiedPath, tuple[_catalog.QualifiedPath, ...]
+    ]
     generic_parameter_paths: dict[
         _catalog.Path, dict[_catalog.Path, tuple[_catalog.Path, ...]]
     ]
     module_class_base_nodes: dict[
         _catalog.Path, dict[_catalog.Path, list[_ast.expr]]
     ]
+    module_closure_digests: dict[_catalog.Path, str]
     module_definitions: dict[_catalog.Path, _ScopeDefinitions]
+    module_digests: dict[_catalog.Path, str]
+    module_members: dict[_catalog.Path, _ModuleMembers]
     module_references: dict[_catalog.Path, _ModuleReferences]
     module_statement_nodes: dict[_catalog.Path, _ModuleStatementNodes]
     module_statement_node_kinds: dict[_catalog.Path, _ModuleStatementNodeKinds]
     module_submodules: dict[_catalog.Path, _ModuleSubmodules]
     module_superclasses: dict[_catalog.Path, _ModuleSuperclasses]
+    module_symbols: dict[_catalog.Path, _ModuleSymbols]
+    # modules loading populates several mappings non-atomically,
+    # so it is serialized between threads
+    loading_lock: _threading.RLock
+    resolved_object_paths: dict[
+        tuple[_catalog.Path, _catalog.Path, _catalog.Path],
+        _catalog.QualifiedPath | _Missing,
+    ]
 
     def __init__(
         self, all_modules_paths: _Collection[_catalog.Path], /
     ) -> None:
         self.all_module_paths = all_modules_paths
+        self.class_mros = {}
         self.generic_parameter_paths = {}
         self.module_class_base_nodes = {}
+        self.module_closure_digests = {}
         self.module_definitions = {}
+        self.module_digests = {}
+        self.module_members = {}
         self.module_references = {}
         self.module_statement_nodes = {}
         self.module_statement_node_kinds = {}
         self.module_submodules = {}
         self.module_superclasses = {}
+        self.module_symbols = {}
+        self.loading_lock = _threading.RLock()
+        self.resolved_object_paths = {}
         builtins_module_path = _catalog.module_path_from_module(_builtins)
         _process_module(
             _sources.from_module_path(builtins_module_path),
@@ -693,6 +798,7 @@ def _parse_module_scope(
     /,
     *,
     cache_directory_path: _Path = _CACHE_ROOT_DIRECTORY_PATH / 'generic',
+    objects_directory_path: _Path = _OBJECTS_ROOT_DIRECTORY_PATH / 'generic',
 ) -> _ScopeDefinitions:
     if (
         module_definitions := state.module_definitions.get(
@@ -701,21 +807,29 @@ def _parse_module_scope(
     ) is not _MISSING:
         assert not isinstance(module_definitions, _Missing)
         return module_definitions
-    if source_path.stem == _file_system.INIT_MODULE_NAME:
-        package_directory_path = cache_directory_path.joinpath(*module_path)
-        package_directory_path.mkdir(exist_ok=True, parents=True)
-        cache_file_path = package_directory_path / (
-            f'{_file_system.INIT_MODULE_NAME}{_file_system.MODULE_FILE_SUFFIX}'
+    manifest_file_path = _to_cache_file_path(
+        cache_directory_path, source_path, module_path
+    )
+    try:
+        module_digest = _caching.load(
+            manifest_file_path, _ManifestFieldName.DIGEST
         )
-    else:
-        package_directory_path = cache_directory_path.joinpath(
-            *module_path[:-1]
+    except Exception:
+        # module path is a part of the key
+        # since relative imports are resolved against it
+        module_digest = _caching.to_digest(
+            _EVALUATION_CONTEXT.encode(),
+            _catalog.path_to_string(module_path).encode(),
+            source_path.read_bytes(),
         )
-        package_directory_path.mkdir(exist_ok=True, parents=True)
-        cache_file_path = (
-            package_directory_path
-            / f'{module_path[-1]}{_file_system.MODULE_FILE_SUFFIX}'
+        _caching.save(
+            manifest_file_path, **{_ManifestFieldName.DIGEST: module_digest}
         )
+    assert isinstance(module_digest, str), module_digest
+    _set_absent_key(state.module_digests, module_path, module_digest)
+    cache_file_path = _caching.to_object_file_path(
+        objects_directory_path, module_digest
+    )
     module_class_base_raw_nodes: _ModuleRawNodes
     module_raw_statement_nodes: _ModuleRawNodes
     try:
@@ -727,9 +841,11 @@ def _parse_module_scope(
             module_raw_statement_node_kinds,
             module_references,
             module_submodules,
-            cached_version,
-        ) = _caching.load(
+        ) = _caching.load_migrated(
             cache_file_path,
+            _GenericFieldName.SCHEMA_VERSION,
+            _GENERIC_SCHEMA_VERSION,
+            _GENERIC_SCHEMA_MIGRATIONS,
             _GenericFieldName.CLASS_BASE_RAW_NODES,
             _GenericFieldName.DEFINITIONS,
             _GenericFieldName.GENERICS_PARAMETER_PATHS,
@@ -737,64 +853,62 @@ def _parse_module_scope(
             _GenericFieldName.RAW_STATEMENT_NODE_KINDS,
             _GenericFieldName.REFERENCES,
             _GenericFieldName.SUBMODULES,
-            _GenericFieldName.VERSION,
         )
     except Exception:
         pass
     else:
-        if cached_version == _version:
-            _set_absent_key(
-                state.module_class_base_nodes,
-                module_path,
-                {
-                    class_object_path: [
-                        _construction.from_raw(raw_node, cls=_ast.expr)
-                        for raw_node in class_base_raw_nodes
-                    ]
-                    for class_object_path, class_base_raw_nodes in (
-                        module_class_base_raw_nodes.items()
-                    )
-                },
-            )
-            _set_absent_key(
-                state.module_definitions, module_path, module_definitions
-            )
-            _set_absent_key(
-                state.generic_parameter_paths,
-                module_path,
-                module_generic_parameter_paths,
-            )
-            _set_absent_key(
-                state.module_references, module_path, module_references
-            )
-            _set_absent_key(
-                state.module_statement_nodes,
-                module_path,
-                {
-                    object_path: [
-                        _construction.from_raw(raw_node, cls=_ast.stmt)
-                        for raw_node in raw_nodes
-                    ]
-                    for object_path, raw_nodes in (
-                        module_raw_statement_nodes.items()
-                    )
-                },
-            )
-            _set_absent_key(
-                state.module_statement_node_kinds,
-                module_path,
-                {
-                    object_path: _StatementNodeKind(raw_node_kind)
-                    for object_path, raw_node_kind in (
-                        module_raw_statement_node_kinds.items()
-                    )
-                },
-            )
-            _set_absent_key(
-                state.module_submodules, module_path, module_submodules
-            )
-            assert isinstance(module_definitions, dict), module_definitions
-            return module_definitions
+        _set_absent_key(
+            state.module_class_base_nodes,
+            module_path,
+            {
+                class_object_path: [
+                    _construction.from_raw(raw_node, cls=_ast.expr)
+                    for raw_node in class_base_raw_nodes
+                ]
+                for class_object_path, class_base_raw_nodes in (
+                    module_class_base_raw_nodes.items()
+                )
+            },
+        )
+        _set_absent_key(
+            state.module_definitions, module_path, module_definitions
+        )
+        _set_absent_key(
+            state.generic_parameter_paths,
+            module_path,
+            module_generic_parameter_paths,
+        )
+        _set_absent_key(
+            state.module_references, module_path, module_references
+        )
+        _set_absent_key(
+            state.module_statement_nodes,
+            module_path,
+            {
+                object_path: [
+                    _construction.from_raw(raw_node, cls=_ast.stmt)
+                    for raw_node in raw_nodes
+                ]
+                for object_path, raw_nodes in (
+                    module_raw_statement_nodes.items()
+                )
+            },
+        )
+        _set_absent_key(
+            state.module_statement_node_kinds,
+            module_path,
+            {
+                object_path: _StatementNodeKind(raw_node_kind)
+                for object_path, raw_node_kind in (
+                    module_raw_statement_node_kinds.items()
+                )
+            },
+        )
+        _set_absent_key(
+            state.module_submodules, module_path, module_submodules
+        )
+        assert isinstance(module_definitions, dict), module_definitions
+        return module_definitions
     (
         module_definitions,
         module_references,
@@ -838,12 +952,32 @@ def _parse_module_scope(
             _GenericFieldName.SUBMODULES: state.module_submodules.get(
                 module_path, []
             ),
-            _GenericFieldName.VERSION: _version,
+            _GenericFieldName.SCHEMA_VERSION: _GENERIC_SCHEMA_VERSION,
         },
     )
     return module_definitions
 
 
+def _to_cache_file_path(
+    cache_directory_path: _Path,
+    source_path: _sources.Path,
+    module_path: _catalog.Path,
+    /,
+) -> _Path:
+    if source_path.stem == _file_system.INIT_MODULE_NAME:
+        package_directory_path = cache_directory_path.joinpath(*module_path)
+        package_directory_path.mkdir(exist_ok=True, parents=True)
+        return package_directory_path / (
+            f'{_file_system.INIT_MODULE_NAME}{_file_system.MODULE_FILE_SUFFIX}'
+        )
+    package_directory_path = cache_directory_path.joinpath(*module_path[:-1])
+    package_directory_path.mkdir(exist_ok=True, parents=True)
+    return (
+        package_directory_path
+        / f'{module_path[-1]}{_file_system.MODULE_FILE_SUFFIX}'
+    )
+
+
 def _init_module_state(
     state: _State, module_path: _catalog.Path, /
 ) -> tuple[
@@ -912,8 +1046,8 @@ class _SpecializeGeneric(_ast.NodeTransformer):
         )
 
 
-def _parse_module_states(
-    module_paths: _Collection[_catalog.Path], /
+def _to_lazy_mappings(
+    state: _State, /
 ) -> tuple[
     _Mapping[_catalog.Path, _ScopeDefinitions],
     _Mapping[_catalog.Path, _ModuleReferences],
@@ -922,7 +1056,6 @@ def _parse_module_states(
     _Mapping[_catalog.Path, _ModuleSubmodules],
     _Mapping[_catalog.Path, _ModuleSuperclasses],
 ]:
-    state = _State(module_paths)
     return (
         _LazyMappingWrapper(
             state.module_definitions, loader=_parse_module_scope, state=state
@@ -1009,39 +1142,45 @@ def _process_module(
             )
         )
     _process_module_superclasses(
-        source_path,
         module_path,
         state.module_class_base_nodes.get(module_path, {}),
+        parsed_module_paths,
         state,
     )
 
 
 def _process_module_superclasses(
-    source_path: _sources.Path,
     module_path: _catalog.Path,
     module_class_base_nodes: dict[_catalog.Path, list[_ast.expr]],
+    closure_module_paths: _Collection[_catalog.Path],
     state: _State,
     /,
     *,
-    cache_directory_path: _Path = _CACHE_ROOT_DIRECTORY_PATH / 'specialized',
+    objects_directory_path: _Path = (
+        _OBJECTS_ROOT_DIRECTORY_PATH / 'specialized'
+    ),
 ) -> None:
     if state.module_superclasses.get(module_path, _MISSING) is not _MISSING:
         return
-    if source_path.stem == _file_system.INIT_MODULE_NAME:
-        package_directory_path = cache_directory_path.joinpath(*module_path)
-        package_directory_path.mkdir(exist_ok=True, parents=True)
-        cache_file_path = package_directory_path / (
-            f'{_file_system.INIT_MODULE_NAME}{_file_system.MODULE_FILE_SUFFIX}'
-        )
-    else:
-        package_directory_path = cache_directory_path.joinpath(
-            *module_path[:-1]
-        )
-        package_directory_path.mkdir(exist_ok=True, parents=True)
-        cache_file_path = (
-            package_directory_path
-            / f'{module_path[-1]}{_file_system.MODULE_FILE_SUFFIX}'
+    # specialization depends on the whole modules closure,
+    # so its key is derived from the keys of closure members
+    closure_digest = state.module_closure_digests[module_path] = (
+        _caching.to_digest(
+            _EVALUATION_CONTEXT.encode(),
+            _catalog.path_to_string(module_path).encode(),
+            *[
+                (
+                    _catalog.path_to_string(closure_module_path)
+                    + _catalog.SEPARATOR
+                    + state.module_digests[closure_module_path]
+                ).encode()
+                for closure_module_path in sorted(closure_module_paths)
+            ],
         )
+    )
+    cache_file_path = _caching.to_object_file_path(
+        objects_directory_path, closure_digest
+    )
     specialization_scope_name = _scoping.SPECIALIZATION_SCOPE_NAME
     specialization_raw_statement_nodes: dict[
         _catalog.Path, list[_conversion.RawNode]
@@ -1053,49 +1192,49 @@ def _process_module_superclasses(
             specialization_raw_statement_node_kinds,
             module_references,
             module_superclasses,
-            cached_version,
-        ) = _caching.load(
+        ) = _caching.load_migrated(
             cache_file_path,
+            _SpecializedFieldName.SCHEMA_VERSION,
+            _SPECIALIZED_SCHEMA_VERSION,
+            _SPECIALIZED_SCHEMA_MIGRATIONS,
             _SpecializedFieldName.DEFINITIONS,
             _SpecializedFieldName.SPECIALIZATION_RAW_STATEMENT_NODES,
             _SpecializedFieldName.SPECIALIZATION_RAW_STATEMENT_NODE_KINDS,
             _SpecializedFieldName.REFERENCES,
             _SpecializedFieldName.SUPERCLASSES,
-            _SpecializedFieldName.VERSION,
         )
     except Exception:
         pass
     else:
-        if cached_version == _version:
-            _set_absent_key(
-                state.module_definitions[module_path],
-                specialization_scope_name,
-                specialization_definitions,
-            )
-            state.module_statement_nodes[module_path].update(
-                {
-                    object_path: [
-                        _construction.from_raw(raw_node, cls=_ast.stmt)
-                        for raw_node in raw_nodes
-                    ]
-                    for object_path, raw_nodes in (
-                        specialization_raw_statement_nodes.items()
-                    )
-                }
-            )
-            state.module_statement_node_kinds[module_path].update(
-                {
-                    object_path: _StatementNodeKind(raw_node_kind)
-                    for object_path, raw_node_kind in (
-                        specialization_raw_statement_node_kinds.items()
-                    )
-                }
-            )
-            state.module_references[module_path] = module_references
-            _set_absent_key(
-                state.module_superclasses, module_path, module_superclasses
-            )
-            return
+        _set_absent_key(
+            state.module_definitions[module_path],
+            specialization_scope_name,
+            specialization_definitions,
+        )
+        state.module_statement_nodes[module_path].update(
+            {
+                object_path: [
+                    _construction.from_raw(raw_node, cls=_ast.stmt)
+                    for raw_node in raw_nodes
+                ]
+                for object_path, raw_nodes in (
+                    specialization_raw_statement_nodes.items()
+                )
+            }
+        )
+        state.module_statement_node_kinds[module_path].update(
+            {
+                object_path: _StatementNodeKind(raw_node_kind)
+                for object_path, raw_node_kind in (
+                    specialization_raw_statement_node_kinds.items()
+                )
+            }
+        )
+        state.module_references[module_path] = module_references
+        _set_absent_key(
+            state.module_superclasses, module_path, module_superclasses
+        )
+        return
     module_superclasses = _set_absent_key(
         state.module_superclasses, module_path, {}
     )
@@ -1146,7 +1285,9 @@ def _process_module_superclasses(
                 module_path
             ],
             _SpecializedFieldName.SUPERCLASSES: module_superclasses,
-            _SpecializedFieldName.VERSION: _version,
+            _SpecializedFieldName.SCHEMA_VERSION: (
+                _SPECIALIZED_SCHEMA_VERSION
+            ),
         },
     )
 
@@ -1373,6 +1514,7 @@ def _set_absent_key(
     return value
 
 
+_state: _Final[_State] = _State(_stdlib_module_paths)
 (
     definitions,
     references,
@@ -1380,4 +1522,345 @@ def _set_absent_key(
     statement_node_kinds,
     submodules,
     superclasses,
-) = _parse_module_states(_stdlib_module_paths)
+) = _to_lazy_mappings(_state)
+
+
+def lookup_object_path(
+    module_path: _catalog.Path,
+    parent_path: _catalog.Path,
+    object_path: _catalog.Path,
+    /,
+) -> _catalog.QualifiedPath | _Missing:
+    key = (module_path, parent_path, object_path)
+    result = _state.resolved_object_paths.get(key)
+    if result is not None:
+        return result
+    if (
+        object_path
+        and (module_symbols := _to_module_symbols(module_path)) is not None
+    ):
+        path = (
+            _catalog.join_paths(parent_path, object_path)
+            if (
+                parent_path
+                and _scoping.scope_contains_path(
+                    definitions[module_path],
+                    _catalog.join_components(parent_path, object_path[0]),
+                )
+            )
+            else object_path
+        )
+        symbol = module_symbols.get(path)
+        if symbol is None:
+            # inherited members are not symbols of the module,
+            # but can be found among members of the resolved class
+            symbol = (
+                _resolve_class_member(module_symbols[path[:-1]], path[-1])
+                if len(path) > 1 and path[:-1] in module_symbols
+                else None
+            )
+        if symbol is not None:
+            _state.resolved_object_paths[key] = symbol
+            return symbol
+    result = _scoping.lookup_object_path(
+        module_path,
+        parent_path,
+        object_path,
+        definitions,
+        references,
+        submodules,
+        superclasses,
+    )
+    _state.resolved_object_paths[key] = result
+    return result
+
+
+def resolve_object_path(
+    module_path: _catalog.Path,
+    parent_path: _catalog.Path,
+    object_path: _catalog.Path,
+    /,
+) -> _catalog.QualifiedPath:
+    result = lookup_object_path(module_path, parent_path, object_path)
+    if result is _MISSING:
+        raise _scoping.ObjectNotFound((module_path, object_path))
+    return result
+
+
+def resolve_mro(
+    module_path: _catalog.Path, object_path: _catalog.Path, /
+) -> tuple[_catalog.QualifiedPath, ...]:
+    qualified_path = (module_path, object_path)
+    try:
+        return _state.class_mros[qualified_path]
+    except KeyError:
+        pass
+    result, _ = _resolve_mro(qualified_path, set())
+    # even if cut short, the result depends only on the class itself
+    _state.class_mros[qualified_path] = result
+    return result
+
+
+def _resolve_mro(
+    qualified_path: _catalog.QualifiedPath,
+    visited_paths: set[_catalog.QualifiedPath],
+    /,
+) -> tuple[tuple[_catalog.QualifiedPath, ...], bool]:
+    try:
+        return _state.class_mros[qualified_path], True
+    except KeyError:
+        pass
+    if qualified_path in visited_paths:
+        # cyclic hierarchies of broken stubs are cut short
+        return (qualified_path,), False
+    visited_paths.add(qualified_path)
+    module_path, object_path = qualified_path
+    try:
+        bases = tuple(superclasses[module_path][object_path])
+    except KeyError:
+        bases = ()
+    bases_mros: list[tuple[_catalog.QualifiedPath, ...]] = []
+    is_complete = True
+    for base in bases:
+        base_mro, is_base_mro_complete = _resolve_mro(base, visited_paths)
+        bases_mros.append(base_mro)
+        is_complete = is_complete and is_base_mro_complete
+    # only ancestors are tracked, so diamonds are not taken for cycles
+    visited_paths.remove(qualified_path)
+    linearization = _merge_mros([*bases_mros, bases])
+    result = (
+        qualified_path,
+        *(
+            # stubs hierarchy can be inconsistent
+            # (e.g. due to version-dependent bases),
+            # falling back to depth-first order without duplicates
+            dict.fromkeys(_chain.from_iterable(bases_mros))
+            if linearization is None
+            else linearization
+        ),
+    )
+    if is_complete:
+        # other threads see finished MROs only
+        _state.class_mros[qualified_path] = result
+    return result, is_complete
+
+
+def _merge_mros(
+    sequences: list[tuple[_catalog.QualifiedPath, ...]], /
+) -> list[_catalog.QualifiedPath] | None:
+    result: list[_catalog.QualifiedPath] = []
+    sequences = [sequence for sequence in sequences if sequence]
+    while sequences:
+        for sequence in sequences:
+            candidate = sequence[0]
+            if not any(
+                candidate in other_sequence[1:] for other_sequence in sequences
+            ):
+                break
+        else:
+            return None
+        result.append(candidate)
+        sequences = [
+            remainder
+            for sequence in sequences
+            if (
+                remainder := sequence[1:]
+                if sequence[0] == candidate
+                else sequence
+            )
+        ]
+    return result
+
+
+def _resolve_class_member(
+    class_qualified_path: _catalog.QualifiedPath, name: str, /
+) -> _catalog.QualifiedPath | None:
+    class_members = _to_class_members(*class_qualified_path)
+    return None if class_members is None else class_members.get(name)
+
+
+def _to_class_members(
+    module_path: _catalog.Path,
+    object_path: _catalog.Path,
+    /,
+    *,
+    objects_directory_path: _Path = _OBJECTS_ROOT_DIRECTORY_PATH / 'members',
+) -> _ClassMembers | None:
+    module_members = _state.module_members.setdefault(module_path, {})
+    cached_result = module_members.get(object_path)
+    if cached_result is not None:
+        return cached_result
+    closure_digest = _state.module_closure_digests.get(module_path)
+    if (
+        closure_digest is None
+        or statement_node_kinds[module_path].get(object_path)
+        is not _StatementNodeKind.CLASS
+    ):
+        return None
+    # superclasses are resolved within the module closure,
+    # so members are keyed by the digest of the specialized entry
+    # along with the class path, tables are built per class
+    # since a lookup needs members of a single class only
+    cache_file_path = _caching.to_object_file_path(
+        objects_directory_path,
+        _caching.to_digest(
+            closure_digest.encode(),
+            _catalog.path_to_string(object_path).encode(),
+        ),
+    )
+    result: _ClassMembers
+    try:
+        result = _caching.load_migrated(
+            cache_file_path,
+            _MembersFieldName.SCHEMA_VERSION,
+            _MEMBERS_SCHEMA_VERSION,
+            _MEMBERS_SCHEMA_MIGRATIONS,
+            _MembersFieldName.MEMBERS,
+        )
+    except Exception:
+        result = _build_class_members(module_path, object_path)
+        _caching.save(
+            cache_file_path,
+            **{
+                _MembersFieldName.MEMBERS: result,
+                _MembersFieldName.SCHEMA_VERSION: _MEMBERS_SCHEMA_VERSION,
+            },
+        )
+    module_members[object_path] = result
+    return result
+
+
+def _build_class_members(
+    module_path: _catalog.Path,
+    object_path: _catalog.Path,
+    /,
+    *,
+    object_qualified_path: _catalog.QualifiedPath = (
+        _catalog.module_path_from_module(_builtins),  # noqa: B008
+        _catalog.path_from_string(object.__qualname__),  # noqa: B008
+    ),
+) -> _ClassMembers:
+    # like in runtime, classes without explicit bases derive from `object`
+    names = dict.fromkeys(
+        _chain.from_iterable(
+            _starmap(
+                _to_class_scope,
+                _chain(
+                    resolve_mro(module_path, object_path),
+                    resolve_mro(*object_qualified_path),
+                ),
+            )
+        )
+    )
+    result: _ClassMembers = {}
+    for name in names:
+        # members are resolved the same way as on demand
+        # to keep results independent of tables availability
+        member_qualified_path = _scoping.lookup_object_path(
+            module_path,
+            (),
+            _catalog.join_components(object_path, name),
+            definitions,
+            references,
+            submodules,
+            superclasses,
+        )
+        if member_qualified_path is not _MISSING:
+            result[name] = member_qualified_path
+    return result
+
+
+def _to_class_scope(
+    module_path: _catalog.Path, object_path: _catalog.Path, /
+) -> _ScopeDefinitions:
+    result = definitions[module_path]
+    for part in object_path:
+        try:
+            result = result[part]
+        except KeyError:
+            return {}
+    return result
+
+
+def _to_module_symbols(
+    module_path: _catalog.Path,
+    /,
+    *,
+    objects_directory_path: _Path = _OBJECTS_ROOT_DIRECTORY_PATH / 'symbols',
+) -> _ModuleSymbols | None:
+    try:
+        return _state.module_symbols[module_path]
+    except KeyError:
+        pass
+    # symbols are resolved by iterating stubs state
+    # which loads in other threads mutate,
+    # so the table is built and saved under the loading lock
+    with _state.loading_lock:
+        return _load_module_symbols(
+            module_path, objects_directory_path=objects_directory_path
+        )
+
+
+def _load_module_symbols(
+    module_path: _catalog.Path, /, *, objects_directory_path: _Path
+) -> _ModuleSymbols | None:
+    try:
+        # the table might have been built while waiting for the lock
+        return _state.module_symbols[module_path]
+    except KeyError:
+        pass
+    try:
+        closure_digest = _state.module_closure_digests[module_path]
+    except KeyError:
+        # module closure is not processed yet,
+        # forcing it for symbols only costs more than it saves
+        return None
+    # names resolve within the module closure,
+    # so symbols are keyed by the same digest as the specialized entry
+    cache_file_path = _caching.to_object_file_path(
+        objects_directory_path, closure_digest
+    )
+    result: _ModuleSymbols
+    try:
+        result = _caching.load_migrated(
+            cache_file_path,
+            _SymbolsFieldName.SCHEMA_VERSION,
+            _SYMBOLS_SCHEMA_VERSION,
+            _SYMBOLS_SCHEMA_MIGRATIONS,
+            _SymbolsFieldName.SYMBOLS,
+        )
+    except Exception:
+        result = {}
+        for object_path in _chain(
+            _to_scope_paths(definitions[module_path]), references[module_path]
+        ):
+            symbol = _scoping.lookup_object_path(
+                module_path,
+                (),
+                object_path,
+                definitions,
+                references,
+                submodules,
+                superclasses,
+            )
+            # broken references are left to be resolved on demand
+            if symbol is not _MISSING:
+                result[object_path] = symbol
+        _caching.save(
+            cache_file_path,
+            **{
+                _SymbolsFieldName.SYMBOLS: result,
+                _SymbolsFieldName.SCHEMA_VERSION: _SYMBOLS_SCHEMA_VERSION,
+            },
+        )
+    _state.module_symbols[module_path] = result
+    return result
+
+
+def _to_scope_paths(
+    scope: _ScopeDefinitions, /, *, parent_path: _catalog.Path = ()
+) -> _Iterator[_catalog.Path]:
+    for name, sub_scope in scope.items():
+        path = _catalog.join_components(parent_path, name)
+        yield path
+        yield from _to_scope_paths(sub_scope, parent_path=path)
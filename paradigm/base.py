@@ -1,17 +1,30 @@
 from __future__ import annotations
 
-from collections.abc import Callable
-from typing import Any, TypeVar, overload
+from collections.abc import Callable, Iterable, Iterator
+from types import ModuleType
+from typing import Any, TYPE_CHECKING, TypeVar, overload
 
 from typing_extensions import Never, TypeVarTuple
 
-from ._core import models as _models, signatures as _signatures
+from ._core import (
+    asynchronous as _asynchronous,
+    memoization as _memoization,
+    models as _models,
+    parallelism as _parallelism,
+    signatures as _signatures,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 OptionalParameter = _models.OptionalParameter
 OverloadedSignature = _models.OverloadedSignature
 ParameterKind = _models.ParameterKind
 PlainSignature = _models.PlainSignature
 RequiredParameter = _models.RequiredParameter
+ResolutionStrategy = _signatures.ResolutionStrategy
+SignatureCacheInfo = _memoization.CacheInfo
+UnsupportedCallable = _signatures.UnsupportedCallable
 
 
 _T1_contra = TypeVar('_T1_contra', contravariant=True)
@@ -151,4 +164,99 @@ def signature_from_callable(
 def signature_from_callable(
     callable_: Callable[..., Any], /
 ) -> OverloadedSignature[Any] | PlainSignature[Any]:
-    return _signatures.from_callable(callable_)
+    return _signatures.memoized_from_callable(callable_)
+
+
+def signature_from_path(
+    name: str, /
+) -> OverloadedSignature[Any] | PlainSignature[Any]:
+    return _signatures.from_path(name)
+
+
+def signatures_from_callables(
+    callables: Iterable[Callable[..., Any]], /
+) -> list[OverloadedSignature[Any] | PlainSignature[Any] | Exception]:
+    """
+    Returns signatures of given callables in the same order,
+    with exceptions in place of the ones failed to resolve.
+
+    A convenience wrapper over `signature_from_callable`,
+    which resolves each distinct callable once without any batching.
+    """
+    return _signatures.from_callables(callables)
+
+
+def signatures_from_module(
+    module: ModuleType, /, *, recursive: bool = False
+) -> dict[str, OverloadedSignature[Any] | PlainSignature[Any] | Exception]:
+    return _signatures.from_module(module, recursive=recursive)
+
+
+def signatures_from_modules(
+    module_names: Iterable[str],
+    /,
+    *,
+    max_workers: int | None = None,
+    recursive: bool = False,
+) -> Iterator[
+    tuple[
+        str,
+        dict[str, OverloadedSignature[Any] | PlainSignature[Any] | Exception],
+    ]
+]:
+    return _parallelism.signatures_from_modules(
+        module_names, max_workers=max_workers, recursive=recursive
+    )
+
+
+def signatures_from_type(
+    cls: type, /
+) -> dict[str, OverloadedSignature[Any] | PlainSignature[Any] | Exception]:
+    return _signatures.from_type(cls)
+
+
+async def async_signature_from_callable(
+    callable_: Callable[..., Any], /, *, executor: Executor | None = None
+) -> OverloadedSignature[Any] | PlainSignature[Any]:
+    return await _asynchronous.signature_from_callable(
+        callable_, executor=executor
+    )
+
+
+async def async_signatures_from_callables(
+    callables: Iterable[Callable[..., Any]],
+    /,
+    *,
+    executor: Executor | None = None,
+) -> list[OverloadedSignature[Any] | PlainSignature[Any] | Exception]:
+    return await _asynchronous.signatures_from_callables(
+        callables, executor=executor
+    )
+
+
+def clear_signature_cache() -> None:
+    _signatures.clear_caches()
+
+
+def set_signature_cache_max_size(max_size: int | None, /) -> None:
+    _signatures.cache.max_size = max_size
+
+
+def signature_cache_info() -> SignatureCacheInfo:
+    return _signatures.cache.info()
+
+
+def set_signature_resolution_strategy(strategy: ResolutionStrategy, /) -> None:
+    _signatures.set_strategy(strategy)
+
+
+def signature_resolution_strategy() -> ResolutionStrategy:
+    return _signatures.get_strategy()
+
+
+def set_signature_unwrapping_depth(max_depth: int, /) -> None:
+    _signatures.set_unwrapping_depth(max_depth)
+
+
+def signature_unwrapping_depth() -> int:
+    return _signatures.get_unwrapping_depth()
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import multiprocessing
+import os
+import random
 import types
 import warnings
-from collections import deque
-from functools import partial, reduce
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from functools import partial, reduce, wraps
 from importlib import import_module
+from operator import attrgetter, itemgetter
+from pathlib import Path
 from types import ModuleType
 from typing import Any
 
@@ -12,6 +18,10 @@ from hypothesis import strategies
 
 from paradigm._core import catalog
 from paradigm._core.discovery import supported_stdlib_module_paths
+from paradigm._core.modules import supported_stdlib_qualified_paths
+from paradigm._core.signatures import resolve_qualified_paths
+from paradigm.base import ResolutionStrategy
+from tests import unsupported
 from tests.contracts import is_supported
 
 
@@ -43,6 +53,155 @@ def find_optional_module_callables_recursively(
     return result
 
 
+def to_closure(default: Any, /) -> Callable[..., Any]:
+    def closure(
+        positional: int,
+        /,
+        keyword: Any = default,
+        *args: str,
+        keyword_only: Any = default,
+        **kwargs: Any,
+    ) -> None:
+        pass
+
+    return closure
+
+
+RebindableAnnotation = Any
+
+
+def _rebindable_closure_template(
+    value: RebindableAnnotation, /
+) -> RebindableAnnotation:
+    return value
+
+
+def to_rebindable_closure(namespace: dict[str, Any], /) -> Callable[..., Any]:
+    # like closures created by the same definition,
+    # shares the code object & string annotations with others
+    result = types.FunctionType(
+        _rebindable_closure_template.__code__, namespace
+    )
+    result.__annotations__ = dict(_rebindable_closure_template.__annotations__)
+    return result
+
+
+def to_exec_generated_function() -> Callable[..., Any]:
+    # like the ones of `collections.namedtuple`,
+    # the function is referred by its own globals
+    namespace: dict[str, Any] = {}
+    exec('def function(value: int, /) -> int:\n    return value', namespace)
+    result: Callable[..., Any] = namespace['function']
+    return result
+
+
+def to_reexporting_module(name: str, /) -> ModuleType:
+    result = ModuleType(name)
+    exec(
+        'from os.path import join\n'
+        'def function(value: int, /) -> int:\n'
+        '    return value',
+        vars(result),
+    )
+    return result
+
+
+def to_self_referencing_class() -> type:
+    class SelfReferencing:
+        def __init__(self, other: Any = None, /) -> None:
+            pass
+
+    # signature of the class refers to the class itself
+    SelfReferencing.__init__.__annotations__['other'] = SelfReferencing
+    return SelfReferencing
+
+
+def to_unresolvable_annotation_class() -> type:
+    class UnresolvableAnnotation:
+        def __init__(self, value: Any, /) -> None:
+            pass
+
+    # like forward references to names which are not defined (yet)
+    UnresolvableAnnotation.__init__.__annotations__['value'] = 'Unresolvable'
+    return UnresolvableAnnotation
+
+
+class ApplicationList(list[Any]):  # noqa: FURB189
+    pass
+
+
+class ApplicationOrderedDict(OrderedDict[Any, Any]):
+    pass
+
+
+def to_nested_partial(
+    callable_: Callable[..., Any], /, *args: Any, **kwargs: Any
+) -> partial[Any]:
+    inner = partial(callable_, *args)
+    # partials with instance attributes do not get flattened on nesting
+    vars(inner)['nested'] = True
+    return partial(inner, **kwargs)
+
+
+class ApplicationPartial(partial[Any]):
+    pass
+
+
+def to_subclass_nested_partial(
+    callable_: Callable[..., Any], /, *args: Any, **kwargs: Any
+) -> partial[Any]:
+    inner = ApplicationPartial(callable_, *args)
+    vars(inner)['nested'] = True
+    return partial(inner, **kwargs)
+
+
+def to_wrapper(wrapped: Callable[..., Any], /) -> Callable[..., Any]:
+    @wraps(wrapped)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        return wrapped(*args, **kwargs)
+
+    return wrapper
+
+
+def to_wrapping_chain() -> tuple[
+    Callable[..., Any], Callable[..., Any], Callable[..., Any]
+]:
+    # wrappers with signatures of their own
+    def inner(a: int, b: str) -> None:
+        pass
+
+    def middle(x: float) -> None:
+        pass
+
+    def outer(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    vars(middle)['__wrapped__'] = inner
+    vars(outer)['__wrapped__'] = middle
+    return outer, middle, inner
+
+
+def to_wrapping_loop() -> Callable[..., Any]:
+    def first(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    def second(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    vars(first)['__wrapped__'] = second
+    vars(second)['__wrapped__'] = first
+    return first
+
+
+def _has_candidate_paths(callable_: Callable[..., Any], /) -> bool:
+    module_path, object_path = catalog.qualified_path_from(callable_)
+    try:
+        supported_stdlib_qualified_paths[module_path][object_path]
+    except KeyError:
+        return False
+    return True
+
+
 def safe_import_module(name: str, /) -> types.ModuleType | None:
     try:
         return import_module(name)
@@ -53,13 +212,104 @@ def safe_import_module(name: str, /) -> types.ModuleType | None:
         return None
 
 
+module_names = strategies.sampled_from(
+    sorted(supported_stdlib_module_paths)
+).map(catalog.path_to_string)
+modules = module_names.map(safe_import_module).filter(bool)
 callables = (
-    strategies.sampled_from(sorted(supported_stdlib_module_paths))
-    .map(catalog.path_to_string)
-    .map(safe_import_module)
-    .map(find_optional_module_callables_recursively)
+    modules.map(find_optional_module_callables_recursively)
     .filter(bool)
     .flatmap(strategies.sampled_from)
 )
 callables |= callables.map(partial)
+closures = strategies.integers().map(to_closure)
+plain_annotations = strategies.sampled_from([bool, bytes, float, int, str])
+flat_and_nested_partials = strategies.builds(
+    lambda closure, positional, keyword_only, to_nested: (
+        partial(closure, positional, keyword_only=keyword_only),
+        to_nested(closure, positional, keyword_only=keyword_only),
+    ),
+    closures,
+    strategies.integers(),
+    strategies.integers(),
+    strategies.sampled_from([to_nested_partial, to_subclass_nested_partial]),
+)
+wrapped_closures = strategies.recursive(
+    closures, lambda step: step.map(to_wrapper), max_leaves=5
+)
+classes = callables.filter(lambda value: isinstance(value, type))
+# methods inherited by application subclasses
+# along with the same methods bound to stdlib classes instances
+inherited_and_stdlib_bound_methods = strategies.sampled_from(
+    [
+        (ApplicationList().append, [].append),
+        (ApplicationList().index, [].index),
+        (
+            ApplicationOrderedDict().move_to_end,
+            OrderedDict[Any, Any]().move_to_end,
+        ),
+        (ApplicationOrderedDict().popitem, OrderedDict[Any, Any]().popitem),
+    ]
+)
+callables_lists = strategies.lists(callables, max_size=10)
+importable_module_names = module_names.filter(
+    lambda name: safe_import_module(name) is not None
+)
+module_names_lists = strategies.lists(importable_module_names, max_size=3)
+missing_module_names = strategies.from_regex(
+    r'\A_paradigm_missing_[a-z]{1,8}\Z'
+)
+reexporting_modules = strategies.from_regex(
+    r'\A_paradigm_reexporting_[a-z]{1,8}\Z'
+).map(to_reexporting_module)
+
+
+unsupported_stdlib_callables: list[Callable[..., Any]] = [
+    *unsupported.built_in_functions,
+    *unsupported.classes,
+    *unsupported.functions,
+    *unsupported.method_descriptors,
+    *unsupported.wrapper_descriptors,
+]
+stubless_stdlib_callables = strategies.sampled_from(
+    sorted(
+        (
+            callable_
+            for callable_ in unsupported_stdlib_callables
+            # objects without candidates are looked up by own paths only
+            if not resolve_qualified_paths(callable_)
+            and not _has_candidate_paths(callable_)
+        ),
+        key=repr,
+    )
+)
+stubless_callables = closures | stubless_stdlib_callables
+unresolvable_annotation_classes = strategies.builds(
+    to_unresolvable_annotation_class
+)
+unresolvable_annotation_callables = (
+    unresolvable_annotation_classes
+    | unresolvable_annotation_classes.map(attrgetter('__init__'))
+)
 overloaded_callables = strategies.sampled_from([int, reduce, super, type])
+unwrapping_depths = strategies.integers(0, 10)
+positive_unwrapping_depths = strategies.integers(1, 10)
+resolution_strategies = strategies.sampled_from(list(ResolutionStrategy))
+stub_paths_with_callables = strategies.sampled_from(
+    [
+        ('builtins.int', int),
+        ('builtins.len', len),
+        ('collections.OrderedDict.move_to_end', OrderedDict.move_to_end),
+        ('functools.reduce', reduce),
+        ('int', int),
+        ('len', len),
+        # reference to a method of a module-level instance
+        ('multiprocessing.Pool', multiprocessing.Pool),
+        ('os.path.join', os.path.join),
+        ('pathlib.Path.open', Path.open),
+        ('random.randint', random.randint),
+    ]
+)
+stub_paths = stub_paths_with_callables.map(itemgetter(0)) | strategies.just(
+    'tkinter.Tk.__init__'
+)
@@ -0,0 +1,104 @@
+import asyncio
+import os
+import subprocess
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    async_signature_from_callable,
+    async_signatures_from_callables,
+    clear_signature_cache,
+    signature_cache_info,
+    signature_from_callable,
+)
+
+from . import strategies
+
+
+@given(strategies.callables)
+def test_basic(callable_: Callable[..., Any]) -> None:
+    result = asyncio.run(async_signature_from_callable(callable_))
+
+    assert isinstance(result, OverloadedSignature | PlainSignature)
+
+
+@given(strategies.callables)
+def test_connection_with_signature_from_callable(
+    callable_: Callable[..., Any],
+) -> None:
+    result = asyncio.run(async_signature_from_callable(callable_))
+
+    assert result == signature_from_callable(callable_)
+
+
+@given(strategies.callables)
+def test_cache_info(callable_: Callable[..., Any]) -> None:
+    clear_signature_cache()
+    asyncio.run(async_signature_from_callable(callable_))
+
+    result = signature_cache_info()
+
+    clear_signature_cache()
+    signature_from_callable(callable_)
+    assert result == signature_cache_info()
+
+
+@given(strategies.callables_lists)
+def test_batch(callables: list[Callable[..., Any]]) -> None:
+    result = asyncio.run(async_signatures_from_callables(callables))
+
+    assert result == [
+        signature_from_callable(callable_) for callable_ in callables
+    ]
+
+
+_COLD_CACHES_BATCH_SCRIPT = """
+import asyncio
+import logging.config
+import sys
+
+from paradigm.base import (
+    async_signatures_from_callables,
+    signature_from_callable,
+)
+
+callables = [
+    sys.unraisablehook,
+    sys.get_int_max_str_digits,
+    logging.config.ConvertingList,
+    len,
+    int,
+    dict.get,
+    asyncio.gather,
+    logging.getLogger,
+]
+results = asyncio.run(async_signatures_from_callables(callables))
+assert results == [
+    signature_from_callable(callable_) for callable_ in callables
+], results
+"""
+
+
+def test_batch_with_cold_caches(tmp_path: Path) -> None:
+    # caches are located in the home directory,
+    # so a fresh one makes concurrent computations populate stubs state
+    result = subprocess.run(
+        [sys.executable, '-c', _COLD_CACHES_BATCH_SCRIPT],
+        capture_output=True,
+        check=False,
+        cwd=Path(__file__).parents[2],
+        env={
+            **os.environ,
+            'HOME': str(tmp_path),
+            'USERPROFILE': str(tmp_path),
+        },
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,123 @@
+import gc
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+from hypothesis import given
+
+from paradigm.base import (
+    PlainSignature,
+    SignatureCacheInfo,
+    clear_signature_cache,
+    set_signature_cache_max_size,
+    signature_cache_info,
+    signature_from_callable,
+)
+
+from . import strategies
+
+
+@given(strategies.callables)
+def test_basic(callable_: Callable[..., Any]) -> None:
+    signature_from_callable(callable_)
+
+    result = signature_cache_info()
+
+    assert type(result) is SignatureCacheInfo
+
+
+@given(strategies.callables)
+def test_idempotence(callable_: Callable[..., Any]) -> None:
+    result = signature_from_callable(callable_)
+
+    assert signature_from_callable(callable_) == result
+
+
+@given(strategies.callables)
+def test_clearing(callable_: Callable[..., Any]) -> None:
+    signature_from_callable(callable_)
+
+    clear_signature_cache()
+
+    result = signature_cache_info()
+
+    assert result.hits == result.misses == result.size == 0
+
+
+@given(strategies.callables)
+def test_max_size(callable_: Callable[..., Any]) -> None:
+    max_size = signature_cache_info().max_size
+    set_signature_cache_max_size(0)
+
+    try:
+        signature_from_callable(callable_)
+
+        result = signature_cache_info()
+    finally:
+        set_signature_cache_max_size(max_size)
+
+    assert result.max_size == result.size == 0
+
+
+@given(strategies.closures, strategies.closures)
+def test_reassigned_defaults(
+    closure: Callable[..., Any], other_closure: Callable[..., Any]
+) -> None:
+    signature_from_callable(closure)
+    closure.__defaults__, closure.__kwdefaults__ = (
+        other_closure.__defaults__,
+        other_closure.__kwdefaults__,
+    )
+
+    result = signature_from_callable(closure)
+
+    assert result == signature_from_callable(other_closure)
+
+
+@given(strategies.plain_annotations, strategies.plain_annotations)
+def test_rebound_annotations(
+    first_annotation: Any, second_annotation: Any
+) -> None:
+    namespace = {
+        '__name__': __name__,
+        'RebindableAnnotation': first_annotation,
+    }
+    closure = strategies.to_rebindable_closure(namespace)
+    signature_from_callable(closure)
+    namespace['RebindableAnnotation'] = second_annotation
+
+    result = signature_from_callable(closure)
+
+    assert isinstance(result, PlainSignature)
+    assert [parameter.annotation for parameter in result.parameters] == [
+        second_annotation
+    ]
+    assert result.returns is second_annotation
+
+
+def test_self_referencing_values() -> None:
+    max_size = signature_cache_info().max_size
+    cls = strategies.to_self_referencing_class()
+    cls_reference = weakref.ref(cls)
+    signature_from_callable(cls)
+    del cls
+
+    assert max_size is not None
+    # evicting the entry with ones of other callables
+    closures = [strategies.to_closure(index) for index in range(max_size)]
+    for closure in closures:
+        signature_from_callable(closure)
+    gc.collect()
+
+    assert cls_reference() is None
+
+
+def test_exec_generated_functions() -> None:
+    function = strategies.to_exec_generated_function()
+    function_reference = weakref.ref(function)
+    signature_from_callable(function)
+    del function
+
+    gc.collect()
+
+    assert function_reference() is None
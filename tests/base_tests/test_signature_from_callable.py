@@ -1,10 +1,13 @@
+import inspect
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from hypothesis import given
 
 from paradigm.base import (
     OverloadedSignature,
+    ParameterKind,
     PlainSignature,
     signature_from_callable,
 )
@@ -24,3 +27,74 @@ def test_overloaded(callable_: Callable[..., Any]) -> None:
     result = signature_from_callable(callable_)
 
     assert isinstance(result, OverloadedSignature)
+
+
+@given(strategies.closures)
+def test_closures(closure: Callable[..., Any]) -> None:
+    result = signature_from_callable(closure)
+
+    raw_signature = inspect.signature(closure, eval_str=True)
+    assert isinstance(result, PlainSignature)
+    assert [
+        (parameter.name, parameter.kind, parameter.annotation)
+        for parameter in result.parameters
+    ] == [
+        (parameter.name, ParameterKind(parameter.kind), parameter.annotation)
+        for parameter in raw_signature.parameters.values()
+    ]
+    assert result.returns == raw_signature.return_annotation
+
+
+@given(strategies.plain_annotations, strategies.plain_annotations)
+def test_closures_with_rebound_annotations(
+    first_annotation: Any, second_annotation: Any
+) -> None:
+    namespace = {
+        '__name__': __name__,
+        'RebindableAnnotation': first_annotation,
+    }
+    first_result = signature_from_callable(
+        strategies.to_rebindable_closure(namespace)
+    )
+    namespace['RebindableAnnotation'] = second_annotation
+
+    second_result = signature_from_callable(
+        strategies.to_rebindable_closure(namespace)
+    )
+
+    assert isinstance(first_result, PlainSignature)
+    assert isinstance(second_result, PlainSignature)
+    assert [parameter.annotation for parameter in first_result.parameters] == [
+        first_annotation
+    ]
+    assert [
+        parameter.annotation for parameter in second_result.parameters
+    ] == [second_annotation]
+    assert second_result.returns is second_annotation
+
+
+@given(strategies.flat_and_nested_partials)
+def test_nested_partials(
+    flat_and_nested_partials: tuple[partial[Any], partial[Any]],
+) -> None:
+    flat_partial, nested_partial = flat_and_nested_partials
+
+    result = signature_from_callable(nested_partial)
+
+    assert isinstance(nested_partial.func, partial)
+    assert result == signature_from_callable(flat_partial)
+
+
+@given(strategies.inherited_and_stdlib_bound_methods)
+def test_inherited_bound_methods(
+    inherited_and_stdlib_bound_methods: tuple[
+        Callable[..., Any], Callable[..., Any]
+    ],
+) -> None:
+    inherited_bound_method, stdlib_bound_method = (
+        inherited_and_stdlib_bound_methods
+    )
+
+    result = signature_from_callable(inherited_bound_method)
+
+    assert result == signature_from_callable(stdlib_bound_method)
@@ -0,0 +1,31 @@
+from collections.abc import Callable
+from typing import Any
+
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    signature_from_callable,
+    signature_from_path,
+)
+
+from . import strategies
+
+
+@given(strategies.stub_paths)
+def test_basic(name: str) -> None:
+    result = signature_from_path(name)
+
+    assert isinstance(result, OverloadedSignature | PlainSignature)
+
+
+@given(strategies.stub_paths_with_callables)
+def test_consistency(
+    name_with_callable: tuple[str, Callable[..., Any]],
+) -> None:
+    name, callable_ = name_with_callable
+
+    result = signature_from_path(name)
+
+    assert result == signature_from_callable(callable_)
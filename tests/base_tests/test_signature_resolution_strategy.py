@@ -0,0 +1,87 @@
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    ResolutionStrategy,
+    set_signature_resolution_strategy,
+    signature_from_callable,
+    signature_resolution_strategy,
+)
+
+from . import strategies
+
+
+@given(strategies.resolution_strategies)
+def test_basic(strategy: ResolutionStrategy) -> None:
+    set_signature_resolution_strategy(strategy)
+
+    try:
+        result = signature_resolution_strategy()
+    finally:
+        set_signature_resolution_strategy(ResolutionStrategy.AUTO)
+
+    assert result is strategy
+
+
+@given(strategies.closures, strategies.resolution_strategies)
+def test_closures(
+    closure: Callable[..., Any], strategy: ResolutionStrategy
+) -> None:
+    set_signature_resolution_strategy(strategy)
+
+    try:
+        result: PlainSignature[Any] | OverloadedSignature[Any] | None = (
+            signature_from_callable(closure)
+        )
+    except ValueError:
+        result = None
+    finally:
+        set_signature_resolution_strategy(ResolutionStrategy.AUTO)
+
+    assert (
+        result is None
+        if strategy is ResolutionStrategy.STUB_ONLY
+        else (
+            isinstance(result, PlainSignature)
+            and [parameter.name for parameter in result.parameters]
+            == list(inspect.signature(closure).parameters)
+        )
+    )
+
+
+@given(strategies.overloaded_callables)
+def test_stubs_only(callable_: Callable[..., Any]) -> None:
+    set_signature_resolution_strategy(ResolutionStrategy.STUB_ONLY)
+
+    try:
+        result = signature_from_callable(callable_)
+    finally:
+        set_signature_resolution_strategy(ResolutionStrategy.AUTO)
+
+    assert isinstance(result, OverloadedSignature)
+
+
+@given(
+    strategies.unresolvable_annotation_callables,
+    strategies.resolution_strategies,
+)
+def test_runtime_failures(
+    callable_: Callable[..., Any], strategy: ResolutionStrategy
+) -> None:
+    set_signature_resolution_strategy(strategy)
+
+    try:
+        with pytest.raises(
+            ValueError
+            if strategy is ResolutionStrategy.STUB_ONLY
+            else NameError
+        ):
+            signature_from_callable(callable_)
+    finally:
+        set_signature_resolution_strategy(ResolutionStrategy.AUTO)
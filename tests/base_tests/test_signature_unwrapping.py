@@ -0,0 +1,109 @@
+import inspect
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from paradigm.base import (
+    ParameterKind,
+    PlainSignature,
+    RequiredParameter,
+    set_signature_unwrapping_depth,
+    signature_from_callable,
+    signature_unwrapping_depth,
+)
+
+from . import strategies
+
+
+@given(strategies.unwrapping_depths)
+def test_basic(depth: int) -> None:
+    set_signature_unwrapping_depth(depth)
+
+    try:
+        result = signature_unwrapping_depth()
+    finally:
+        set_signature_unwrapping_depth(0)
+
+    assert result == depth
+
+
+@given(strategies.wrapped_closures, strategies.unwrapping_depths)
+def test_wrappers(wrapper: Callable[..., Any], depth: int) -> None:
+    set_signature_unwrapping_depth(depth)
+
+    try:
+        result = signature_from_callable(wrapper)
+    finally:
+        set_signature_unwrapping_depth(0)
+
+    assert isinstance(result, PlainSignature)
+    assert (
+        result == signature_from_callable(inspect.unwrap(wrapper))
+        if depth == 0 or depth >= to_wrapping_depth(wrapper)
+        # unwrapping stops at the wrapper of variadic parameters
+        else all(
+            parameter.kind
+            in (
+                ParameterKind.VARIADIC_KEYWORD,
+                ParameterKind.VARIADIC_POSITIONAL,
+            )
+            for parameter in result.parameters
+        )
+    )
+
+
+@given(strategies.positive_unwrapping_depths)
+def test_depth(depth: int) -> None:
+    outer, middle, _ = strategies.to_wrapping_chain()
+    set_signature_unwrapping_depth(depth)
+
+    try:
+        result = signature_from_callable(outer)
+        middle_result = signature_from_callable(middle)
+    finally:
+        set_signature_unwrapping_depth(0)
+
+    inner_signature: PlainSignature[Any] = PlainSignature(
+        RequiredParameter(
+            annotation=int, kind=ParameterKind.POSITIONAL_OR_KEYWORD, name='a'
+        ),
+        RequiredParameter(
+            annotation=str, kind=ParameterKind.POSITIONAL_OR_KEYWORD, name='b'
+        ),
+        returns=None,
+    )
+    assert result == (
+        PlainSignature(
+            RequiredParameter(
+                annotation=float,
+                kind=ParameterKind.POSITIONAL_OR_KEYWORD,
+                name='x',
+            ),
+            returns=None,
+        )
+        if depth == 1
+        else inner_signature
+    )
+    assert middle_result == inner_signature
+
+
+@given(strategies.positive_unwrapping_depths)
+def test_loops(depth: int) -> None:
+    wrapper = strategies.to_wrapping_loop()
+    set_signature_unwrapping_depth(depth)
+
+    try:
+        with pytest.raises(ValueError, match='wrapper loop'):
+            signature_from_callable(wrapper)
+    finally:
+        set_signature_unwrapping_depth(0)
+
+
+def to_wrapping_depth(wrapper: Callable[..., Any], /) -> int:
+    result = 0
+    while hasattr(wrapper, '__wrapped__'):
+        wrapper = wrapper.__wrapped__
+        result += 1
+    return result
@@ -0,0 +1,45 @@
+from collections.abc import Callable
+from typing import Any
+
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    signature_from_callable,
+    signatures_from_callables,
+)
+
+from . import strategies
+
+
+@given(strategies.callables_lists)
+def test_basic(callables: list[Callable[..., Any]]) -> None:
+    result = signatures_from_callables(callables)
+
+    assert isinstance(result, list)
+    assert len(result) == len(callables)
+    assert all(
+        isinstance(element, OverloadedSignature | PlainSignature)
+        for element in result
+    )
+
+
+@given(strategies.callables_lists)
+def test_connection_with_signature_from_callable(
+    callables: list[Callable[..., Any]],
+) -> None:
+    result = signatures_from_callables(callables)
+
+    assert result == [
+        signature_from_callable(callable_) for callable_ in callables
+    ]
+
+
+@given(strategies.callables_lists)
+def test_failures(callables: list[Callable[..., Any]]) -> None:
+    invalid_callables: list[Any] = [*callables, object()]
+
+    result = signatures_from_callables(invalid_callables)
+
+    assert isinstance(result[-1], TypeError)
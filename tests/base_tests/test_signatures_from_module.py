@@ -0,0 +1,58 @@
+from types import ModuleType
+
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    signature_from_callable,
+    signatures_from_module,
+)
+
+from . import strategies
+
+
+@given(strategies.modules)
+def test_basic(module: ModuleType) -> None:
+    result = signatures_from_module(module)
+
+    assert isinstance(result, dict)
+    assert all(isinstance(name, str) for name in result)
+    assert all(
+        isinstance(value, OverloadedSignature | PlainSignature | Exception)
+        for value in result.values()
+    )
+
+
+@given(strategies.modules)
+def test_connection_with_signature_from_callable(module: ModuleType) -> None:
+    result = signatures_from_module(module)
+
+    assert all(
+        value == signature_from_callable(getattr(module, name.split('.')[-1]))
+        for name, value in result.items()
+        if not isinstance(value, Exception)
+    )
+
+
+@given(strategies.modules)
+def test_recursive(module: ModuleType) -> None:
+    result = signatures_from_module(module, recursive=True)
+
+    assert signatures_from_module(module).keys() <= result.keys()
+
+
+@given(strategies.reexporting_modules)
+def test_imported_names(module: ModuleType) -> None:
+    result = signatures_from_module(module)
+
+    assert result.keys() == {module.__name__ + '.function'}
+
+
+@given(strategies.reexporting_modules)
+def test_exported_names(module: ModuleType) -> None:
+    vars(module)['__all__'] = ['join']
+
+    result = signatures_from_module(module)
+
+    assert result.keys() == {module.__name__ + '.join'}
@@ -0,0 +1,44 @@
+from importlib import import_module
+
+import pytest
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    signatures_from_module,
+    signatures_from_modules,
+)
+
+from . import strategies
+
+
+@given(strategies.module_names_lists)
+def test_basic(module_names: list[str]) -> None:
+    result = list(signatures_from_modules(module_names, max_workers=2))
+
+    assert {module_name for module_name, _ in result} == set(module_names)
+    assert all(
+        isinstance(value, OverloadedSignature | PlainSignature | Exception)
+        for _, signatures in result
+        for value in signatures.values()
+    )
+
+
+@given(strategies.module_names_lists)
+def test_connection_with_signatures_from_module(
+    module_names: list[str],
+) -> None:
+    result = dict(signatures_from_modules(module_names, max_workers=2))
+
+    assert all(
+        signatures.keys()
+        == signatures_from_module(import_module(module_name)).keys()
+        for module_name, signatures in result.items()
+    )
+
+
+@given(strategies.missing_module_names)
+def test_import_failures(module_name: str) -> None:
+    with pytest.raises(ImportError):
+        list(signatures_from_modules([module_name], max_workers=1))
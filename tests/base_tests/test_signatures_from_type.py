@@ -0,0 +1,50 @@
+from typing import Any
+
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    signature_from_callable,
+    signatures_from_type,
+)
+
+from . import strategies
+
+
+@given(strategies.classes)
+def test_basic(cls: type) -> None:
+    result = signatures_from_type(cls)
+
+    assert isinstance(result, dict)
+    assert all(isinstance(name, str) for name in result)
+    assert all(
+        isinstance(value, OverloadedSignature | PlainSignature | Exception)
+        for value in result.values()
+    )
+
+
+@given(strategies.classes)
+def test_members(cls: type) -> None:
+    result = signatures_from_type(cls)
+
+    assert result.keys() <= set(dir(cls))
+    assert all(callable(getattr(cls, name)) for name in result)
+
+
+@given(strategies.classes)
+def test_consistency(cls: type) -> None:
+    result = signatures_from_type(cls)
+
+    for name, signature in result.items():
+        try:
+            expected: (
+                OverloadedSignature[Any] | PlainSignature[Any] | Exception
+            ) = signature_from_callable(getattr(cls, name))
+        except Exception as error:
+            expected = error
+        assert (
+            type(signature) is type(expected)
+            if isinstance(expected, Exception)
+            else signature == expected
+        )
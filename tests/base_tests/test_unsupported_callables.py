@@ -0,0 +1,49 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from hypothesis import given
+
+from paradigm.base import (
+    OverloadedSignature,
+    PlainSignature,
+    ResolutionStrategy,
+    UnsupportedCallable,
+    set_signature_resolution_strategy,
+    signature_from_callable,
+)
+
+from . import strategies
+
+
+@given(strategies.stubless_callables)
+def test_basic(callable_: Callable[..., Any]) -> None:
+    try:
+        result: OverloadedSignature[Any] | PlainSignature[Any] | ValueError = (
+            signature_from_callable(callable_)
+        )
+    except ValueError as error:
+        result = error
+
+    assert isinstance(
+        result, OverloadedSignature | PlainSignature | ValueError
+    )
+    # runtime failures are not disguised
+    assert not isinstance(result, UnsupportedCallable)
+
+
+@given(strategies.unresolvable_annotation_callables)
+def test_runtime_failures(callable_: Callable[..., Any]) -> None:
+    with pytest.raises(NameError):
+        signature_from_callable(callable_)
+
+
+@given(strategies.stubless_callables)
+def test_stubs_only(callable_: Callable[..., Any]) -> None:
+    set_signature_resolution_strategy(ResolutionStrategy.STUB_ONLY)
+
+    try:
+        with pytest.raises(UnsupportedCallable):
+            signature_from_callable(callable_)
+    finally:
+        set_signature_resolution_strategy(ResolutionStrategy.AUTO)
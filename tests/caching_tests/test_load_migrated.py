@@ -0,0 +1,41 @@
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from paradigm._core import caching
+
+
+def _append_two(values: dict[str, Any], /) -> dict[str, Any]:
+    return {**values, 'items': [*values['items'], 2]}
+
+
+def _rename_items(values: dict[str, Any], /) -> dict[str, Any]:
+    return {'elements': values['items']}
+
+
+def test_migration(tmp_path: Path) -> None:
+    path = tmp_path / '_entry.py'
+    caching.save(path, items=[1], schema_version=1)
+
+    result = caching.load_migrated(
+        path,
+        'schema_version',
+        3,
+        {1: _append_two, 2: _rename_items},
+        'elements',
+    )
+
+    assert result == [1, 2]
+    # entry is upgraded in-place
+    assert caching.load(path, 'elements', 'schema_version') == ([1, 2], 3)
+
+
+def test_missing_migration(tmp_path: Path) -> None:
+    path = tmp_path / '_entry.py'
+    caching.save(path, items=[1], schema_version=1)
+
+    with pytest.raises(caching.OutdatedSchema):
+        caching.load_migrated(
+            path, 'schema_version', 3, {2: _rename_items}, 'elements'
+        )
@@ -0,0 +1,22 @@
+import _frozen_importlib
+import sys
+from types import ModuleType
+
+from hypothesis import given, strategies
+
+from paradigm._core.modules import is_stdlib_module
+
+
+def test_built_in_modules() -> None:
+    assert is_stdlib_module(sys)
+
+
+def test_frozen_modules() -> None:
+    # has no file, but is a part of standard library
+    assert is_stdlib_module(_frozen_importlib)
+
+
+@given(strategies.from_regex(r'\A_paradigm_dynamic_[a-z]{1,8}\Z'))
+def test_dynamic_modules(module_name: str) -> None:
+    # like REPL's `__main__`, has no file and is not from standard library
+    assert not is_stdlib_module(ModuleType(module_name))
@@ -0,0 +1,23 @@
+import colorsys
+import importlib.util
+import sys
+
+from paradigm._core.modules import supported_stdlib_qualified_paths
+
+
+def test_replaced_modules() -> None:
+    generation = supported_stdlib_qualified_paths.generation
+    module_spec = importlib.util.find_spec(colorsys.__name__)
+    assert module_spec is not None
+    assert module_spec.loader is not None
+    replacement = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(replacement)
+    # replacement keeps modules count the same
+    sys.modules[colorsys.__name__] = replacement
+
+    try:
+        result = supported_stdlib_qualified_paths.generation
+    finally:
+        sys.modules[colorsys.__name__] = colorsys
+
+    assert result > generation